@@ -0,0 +1,386 @@
+"""
+Benchmark suite for `pyobjectify.from_url`.
+
+Fixtures of every input type are generated at the requested sizes, and each one is converted from the local disk
+and from a local HTTP server standing in for the Internet. Each stage of `from_url` is timed separately
+(retrieve, detect, load, convert), and the peak memory of a whole conversion is measured with tracemalloc.
+
+Results can be saved as a JSON baseline, and later runs compared against it to flag regressions:
+
+    python benchmarks/bench_from_url.py --sizes 1KB,1MB,100MB --save benchmarks/baseline.json
+    python benchmarks/bench_from_url.py --sizes 1KB,1MB,100MB --compare benchmarks/baseline.json
+
+Baselines are only comparable on the machine they were recorded on, so they are not checked in.
+"""
+
+from argparse import ArgumentParser
+from csv import writer
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from json import dump, dumps, load
+from os import makedirs, path as os_path, replace
+from statistics import median
+from sys import exit
+from tempfile import gettempdir
+from threading import Thread
+from tracemalloc import get_traced_memory, start, stop
+
+import pyobjectify as pyob
+from openpyxl import Workbook
+
+try:
+    import pyarrow
+    from pyarrow import ipc, parquet
+except ImportError:  # Parquet and Arrow fixtures are skipped without pyarrow
+    pyarrow = None
+
+UNITS = {"KB": 1024, "MB": 1024**2, "GB": 1024**3}
+"""
+A dictionary from each size suffix accepted by `--sizes` to its number of bytes.
+"""
+
+COLUMNS = ["id", "name", "value", "flag"]
+"""
+The columns of every generated record.
+"""
+
+
+def parse_size(size):
+    """
+    Parse a human-readable size such as "10MB" into a number of bytes.
+
+    Args:
+        size (str): The size, as a number followed by KB, MB or GB.
+
+    Returns:
+        int: The number of bytes.
+    """
+    size = size.strip().upper()
+    return int(float(size[:-2]) * UNITS[size[-2:]])
+
+
+def records():
+    """
+    Generate the records of the fixtures, endlessly.
+
+    Yields:
+        list: The values of each record, in the order of `COLUMNS`.
+    """
+    i = 0
+    while True:
+        yield [i, f"name-{i}", i * 0.5, i % 2 == 0]
+        i += 1
+
+
+def write_text(path, size, header, line, footer=""):
+    """
+    Write a text fixture of about `size` bytes, one record per line.
+
+    Args:
+        path (str): The path to the fixture.
+        size (int): The number of bytes to write, give or take a record.
+        header (str): The text before the first record.
+        line (function): A function formatting a record as a line of text.
+        footer (str, optional): The text after the last record.
+    """
+    with open(path, "w", newline="") as f:
+        written = f.write(header)
+        for record in records():
+            written += f.write(line(record))
+            if written >= size:
+                break
+        f.write(footer)
+
+
+def write_json(path, size):
+    """
+    Write a JSON fixture: a top-level array of records.
+    """
+
+    def line(record):
+        separator = "" if record[0] == 0 else ",\n"  # The id of the first record is 0
+        return separator + dumps(dict(zip(COLUMNS, record)))
+
+    write_text(path, size, "[\n", line, "\n]\n")
+
+
+def write_ndjson(path, size):
+    """
+    Write an NDJSON fixture: one record per line.
+    """
+    write_text(path, size, "", lambda record: dumps(dict(zip(COLUMNS, record))) + "\n")
+
+
+def write_delimited(path, size, delimiter):
+    """
+    Write a CSV or TSV fixture, with a header row.
+    """
+    with open(path, "w", newline="") as f:
+        rows = writer(f, delimiter=delimiter)
+        rows.writerow(COLUMNS)
+        for record in records():
+            rows.writerow(record)
+            if f.tell() >= size:
+                break
+
+
+def write_xml(path, size):
+    """
+    Write an XML fixture, with one element per record.
+    """
+    fields = "".join(f"<{name}>{{{name}}}</{name}>" for name in COLUMNS)
+    write_text(
+        path,
+        size,
+        '<?xml version="1.0" encoding="utf-8"?>\n<records>\n',
+        lambda record: f"<record>{fields.format(**dict(zip(COLUMNS, record)))}</record>\n",
+        "</records>\n",
+    )
+
+
+def count_rows(size):
+    """
+    Estimate the number of records that a binary fixture needs to be about `size` bytes of CSV data.
+    """
+    return max(size // 32, 1)
+
+
+def write_xlsx(path, size):
+    """
+    Write an XLSX fixture with a single sheet, using openpyxl's write-only mode.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sheet1")
+    sheet.append(COLUMNS)
+    for _, record in zip(range(count_rows(size)), records()):
+        sheet.append(record)
+    workbook.save(path)
+
+
+def arrow_table(size):
+    """
+    Build a pyarrow Table of about `size` bytes of CSV data.
+    """
+    n = count_rows(size)
+    return pyarrow.table(
+        {
+            "id": pyarrow.array(range(n)),
+            "name": pyarrow.array(f"name-{i}" for i in range(n)),
+            "value": pyarrow.array(i * 0.5 for i in range(n)),
+            "flag": pyarrow.array(i % 2 == 0 for i in range(n)),
+        }
+    )
+
+
+def write_parquet(path, size):
+    """
+    Write a Parquet fixture.
+    """
+    parquet.write_table(arrow_table(size), path)
+
+
+def write_arrow(path, size):
+    """
+    Write an Arrow IPC fixture, in the file format.
+    """
+    table = arrow_table(size)
+    with ipc.new_file(path, table.schema) as w:
+        w.write_table(table)
+
+
+WRITERS = {
+    pyob.InputType.JSON: ("json", write_json),
+    pyob.InputType.CSV: ("csv", partial(write_delimited, delimiter=",")),
+    pyob.InputType.TSV: ("tsv", partial(write_delimited, delimiter="\t")),
+    pyob.InputType.XML: ("xml", write_xml),
+    pyob.InputType.XLSX: ("xlsx", write_xlsx),
+    pyob.InputType.NDJSON: ("ndjson", write_ndjson),
+}
+"""
+A dictionary of fixture generators,
+where the key is an input type,
+and the value is a pair of the file extension and a function writing a fixture of a given size.
+"""
+
+if pyarrow is not None:
+    WRITERS[pyob.InputType.PARQUET] = ("parquet", write_parquet)
+    WRITERS[pyob.InputType.ARROW] = ("arrow", write_arrow)
+
+
+def fixture(directory, in_type, size):
+    """
+    Get the path to a fixture, generating it unless it was generated by an earlier run.
+
+    Args:
+        directory (str): The directory of the fixtures.
+        in_type (:obj:`InputType`): The input type of the fixture.
+        size (int): The size of the fixture in bytes.
+
+    Returns:
+        str: The path to the fixture.
+    """
+    extension, write = WRITERS[in_type]
+    path = os_path.join(directory, f"{size}.{extension}")
+    if not os_path.exists(path):
+        write(path + ".tmp", size)
+        replace(path + ".tmp", path)  # An interrupted run does not leave a partial fixture behind
+    return path
+
+
+def serve(directory):
+    """
+    Serve a directory over HTTP on a free local port, in a background thread.
+
+    Args:
+        directory (str): The directory to serve.
+
+    Returns:
+        ThreadingHTTPServer: The running server.
+    """
+
+    class QuietHandler(SimpleHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=directory))
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_stages(url):
+    """
+    Convert a resource, timing each stage of `from_url` (see `pyobjectify.Stats`).
+
+    Args:
+        url (str): The URL to the resource.
+
+    Returns:
+        dict: The seconds spent retrieving, detecting, loading and converting the resource, and in total.
+    """
+    stats = pyob.Stats()
+    pyob.from_url(url, stats=stats)
+    timings = {stage: stats.stages.get(stage, 0.0) for stage in ("retrieve", "detect", "load", "convert")}
+    timings["total"] = stats.total
+    return timings
+
+
+def peak_memory(url):
+    """
+    Measure the peak memory allocated by Python while converting a resource.
+
+    Allocations that bypass Python's allocators (e.g. in pyarrow) are not counted.
+
+    Args:
+        url (str): The URL to the resource.
+
+    Returns:
+        int: The peak number of bytes allocated.
+    """
+    start()
+    try:
+        pyob.from_url(url)
+        return get_traced_memory()[1]
+    finally:
+        stop()
+
+
+def benchmark(url, repeat):
+    """
+    Benchmark the conversion of a resource.
+
+    Args:
+        url (str): The URL to the resource.
+        repeat (int): The number of timed runs, of which the median of each stage is reported.
+
+    Returns:
+        dict: The median seconds of each stage, and the peak memory in bytes.
+    """
+    run_stages(url)  # Warm up caches and lazy imports, which would otherwise be charged to the first benchmark
+    runs = [run_stages(url) for _ in range(repeat)]
+    result = {stage: median(run[stage] for run in runs) for stage in runs[0]}
+    result["peak_memory"] = peak_memory(url)
+    return result
+
+
+MIN_DELTAS = {"total": 0.001, "peak_memory": 64 * 1024}
+"""
+A dictionary from each compared metric to the smallest absolute increase (in seconds or bytes) that can count
+as a regression, so that the noise of the smallest benchmarks is not flagged.
+"""
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results against a baseline.
+
+    Args:
+        results (dict): The results of this run.
+        baseline (dict): The results of an earlier run.
+        threshold (float): The relative increase of a total time or peak memory that counts as a regression.
+
+    Returns:
+        list: A description of each regression.
+    """
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        for metric, min_delta in MIN_DELTAS.items():
+            before, after = baseline[key][metric], result[metric]
+            if after > before * (1 + threshold) and after - before > min_delta:
+                change = f" (+{after / before - 1:.0%})" if before > 0 else ""
+                regressions.append(f"{key} {metric}: {before:.6g} -> {after:.6g}{change}")
+    return regressions
+
+
+def main(argv=None):
+    parser = ArgumentParser(description="Benchmark pyobjectify.from_url across formats, sizes and connectivity types.")
+    parser.add_argument("--sizes", default="1KB,1MB,10MB", help="comma-separated fixture sizes, from 1KB to 1GB")
+    parser.add_argument("--formats", default=None, help="comma-separated input types (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark")
+    parser.add_argument("--fixtures", default=os_path.join(gettempdir(), "pyobjectify-benchmarks"))
+    parser.add_argument("--save", metavar="PATH", help="save the results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="flag regressions against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="relative slowdown that counts as a regression")
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(size) for size in args.sizes.split(",")]
+    if args.formats is None:
+        in_types = list(WRITERS)
+    else:
+        in_types = [pyob.InputType[name.strip().upper()] for name in args.formats.split(",")]
+    makedirs(args.fixtures, exist_ok=True)
+
+    server = serve(args.fixtures)
+    url_server = f"http://127.0.0.1:{server.server_address[1]}"
+    print(f"{'benchmark':<32}{'retrieve':>10}{'detect':>10}{'load':>10}{'convert':>10}{'total':>10}{'peak MB':>10}")
+    results = {}
+    try:
+        for in_type in in_types:
+            for size in sizes:
+                path = fixture(args.fixtures, in_type, size)
+                urls = {"local": path, "online": f"{url_server}/{os_path.basename(path)}"}
+                for connectivity, url in urls.items():
+                    key = f"{in_type.name}/{size}/{connectivity}"
+                    result = results[key] = benchmark(url, args.repeat)
+                    stages = ("retrieve", "detect", "load", "convert", "total")
+                    timings = "".join(f"{result[stage]:>10.4f}" for stage in stages)
+                    print(f"{key:<32}{timings}{result['peak_memory'] / 1024 ** 2:>10.1f}")
+    finally:
+        server.shutdown()
+
+    if args.save:
+        with open(args.save, "w") as f:
+            dump(results, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, load(f), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,50 @@
 from ._version import __version__
 from .pyobjectify import (
     InputType,
+    Row,
+    Rows,
+    LazySheets,
     OUTPUT_TYPES,
     CONVERSIONS,
+    CONVERSION_OPTIONS,
+    SNIFF_SIZE,
+    SNIFFERS,
+    SNIFF_COSTS,
+    SNIFF_PRIORITIES,
+    SNIFF_CERTAIN,
+    EXTENSIONS,
+    CONTENT_TYPES,
+    STRUCTURED_SUFFIXES,
+    COMPRESSION_EXTENSIONS,
+    JSON_BACKENDS,
+    set_json_backend,
+    decode_json,
+    PARSERS,
+    STREAMERS,
+    CHUNKERS,
+    CONVERTERS,
+    ENTRY_POINT_GROUP,
+    Format,
+    register_format,
+    load_plugins,
     Connectivity,
+    HTTPCache,
+    PooledSession,
+    get_session,
     Resource,
     url_to_connectivity,
     retrieve_resource,
+    sniff,
     get_resource_types,
+    guess_input_type,
+    hint_resource_types,
     get_conversions,
+    Stats,
     convert,
+    ResultCache,
     from_url,
+    async_from_url,
+    gather_urls,
+    from_urls,
+    iter_url,
 )
@@ -1,10 +1,67 @@
-from csv import DictReader
+from asyncio import gather, get_running_loop, Semaphore
+from bz2 import BZ2File
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import as_completed, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from copy import copy, deepcopy
+from csv import DictReader, Error as CSVError, reader
 from enum import auto, Enum, unique
-from json import loads
-from pandas import DataFrame, json_normalize, read_excel
-from requests import get
+from functools import partial
+from gzip import GzipFile
+from hashlib import sha256
+from importlib.metadata import entry_points
+from io import BufferedReader, BytesIO, RawIOBase, SEEK_CUR, SEEK_END, SEEK_SET, StringIO, TextIOWrapper
+from itertools import chain, islice
+from json import dump, JSONDecoder, load, loads
+from locale import getpreferredencoding
+from lzma import LZMAFile
+from mmap import ACCESS_READ, mmap
+from numpy import ndarray
+from os import cpu_count, listdir, makedirs, path as os_path, remove, replace, stat, utime
+from openpyxl import load_workbook
+from tempfile import TemporaryFile
+from pandas import DataFrame, ExcelFile, json_normalize, read_csv, read_excel
+from requests import Session
+from requests.exceptions import ChunkedEncodingError, ConnectionError as RequestsConnectionError
+from threading import Lock
+from time import perf_counter
+from types import MappingProxyType
+from warnings import warn
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from xml.etree.ElementTree import iterparse, tostring
 from xmltodict import parse
 
+try:
+    from pyarrow import BufferReader, concat_tables, ipc, memory_map, py_buffer, Table
+    from pyarrow.parquet import ParquetFile
+except ImportError:  # pyarrow is an optional dependency, only needed for Parquet and Arrow data
+    ipc = ParquetFile = None
+
+try:
+    from zstandard import ZstdDecompressor
+except ImportError:  # zstandard is an optional dependency, only needed for Zstandard-compressed data
+    ZstdDecompressor = None
+
+# Faster JSON decoders are optional dependencies; the json module is used without them
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
 
 @unique
 class InputType(Enum):
@@ -19,9 +76,67 @@ class InputType(Enum):
     TSV = auto()
     XML = auto()
     XLSX = auto()
+    NDJSON = auto()
+    PARQUET = auto()
+    ARROW = auto()
+
+
+class Row(Mapping):
+    """
+    A compact, read-only row of delimited data.
+
+    The values of a row are held in a tuple, and the column names are held once in an index shared by every row,
+    rather than being repeated as keys in a dictionary for every row. A row otherwise behaves like the dictionaries
+    of `csv.DictReader`: `row["column"]` gets a value, short rows are padded with None,
+    and the values of any extra fields are listed under the key None.
+
+    Args:
+        index (dict): The shared index from each column name to its position.
+        values (tuple): The values of the row.
+    """
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index, values):
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key):
+        if key is None and len(self._values) > len(self._index):
+            return list(self._values[len(self._index) :])
+        position = self._index[key]
+        return self._values[position] if position < len(self._values) else None
+
+    def __iter__(self):
+        yield from self._index
+        if len(self._values) > len(self._index):
+            yield None
 
+    def __len__(self):
+        return len(self._index) + (len(self._values) > len(self._index))
 
-OUTPUT_TYPES = (list, dict, DataFrame)
+    def __repr__(self):
+        return f"Row({dict(self)!r})"
+
+
+class Rows(list):
+    """
+    A list of compact rows (see `Row`) sharing one header.
+
+    Request it as the output type to convert delimited data with a fraction of the memory of a list of dictionaries.
+
+    Args:
+        header (list): The column names.
+        rows (:obj:`Iterable`, optional): The values of each row.
+    """
+
+    def __init__(self, header, rows=()):
+        self.header = list(header)
+        index = {name: position for position, name in enumerate(self.header)}
+        super().__init__(Row(index, tuple(values)) for values in rows)
+
+
+OUTPUT_TYPES = (list, dict, DataFrame, Rows)
 """
 A set of the output types supported by pyobjectify.
 
@@ -30,10 +145,13 @@ The end-user does not have to interface with this, but it is provided for more g
 
 CONVERSIONS = {
     InputType.JSON: [dict, list, DataFrame],
-    InputType.CSV: [list],
-    InputType.TSV: [list],
+    InputType.CSV: [list, DataFrame, dict, Rows],
+    InputType.TSV: [list, DataFrame, dict, Rows],
     InputType.XML: [dict],
     InputType.XLSX: [dict],
+    InputType.NDJSON: [list, DataFrame],
+    InputType.PARQUET: [DataFrame, dict, list],
+    InputType.ARROW: [DataFrame, dict, list],
 }
 """
 A dictionary of allowable conversions,
@@ -43,6 +161,189 @@ and the value is a list of supported output types.
 The end-user does not have to interface with this, but it is provided for more granular operations.
 """
 
+CONVERSION_OPTIONS = {
+    InputType.JSON: ("json_backend",),
+    InputType.NDJSON: ("json_backend",),
+    InputType.XLSX: ("sheets", "lazy"),
+    InputType.PARQUET: ("columns", "row_groups"),
+    InputType.ARROW: ("columns",),
+}
+"""
+A dictionary of the keyword options accepted by conversions (see `convert`),
+where the key is a supported input type,
+and the value is a tuple of the names of the options of the conversions from that input type.
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+
+SNIFF_SIZE = 64 * 1024
+"""
+The number of bytes at the start of a resource that are inspected to determine its input type.
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+SNIFF_LINES = 20
+"""
+The maximum number of records at the start of a resource that are inspected for delimiter statistics.
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+CHUNK_SIZE = 64 * 1024
+"""
+The number of bytes requested at a time when streaming a resource.
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+SPOOL_SIZE = 16 * 1024 * 1024
+"""
+The number of bytes of an Internet resource that are held in memory when it is downloaded in full.
+Larger resources are spooled to a temporary file and memory-mapped, as local files are.
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+MAX_RESUMES = 3
+"""
+The maximum number of times that the download of an Internet resource is resumed after the connection drops.
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+XLSX_SIGNATURE = b"PK\x03\x04"
+"""
+The magic bytes at the start of a ZIP archive, which is the container format of XLSX workbooks.
+"""
+
+PARQUET_SIGNATURE = b"PAR1"
+"""
+The magic bytes at the start (and end) of a Parquet file.
+"""
+
+ARROW_SIGNATURE = b"ARROW1"
+"""
+The magic bytes at the start (and end) of an Arrow IPC file.
+"""
+
+ARROW_STREAM_SIGNATURE = b"\xff\xff\xff\xff"
+"""
+The continuation marker at the start of each message of an Arrow IPC stream.
+"""
+
+
+def _open_gzip(raw):
+    """
+    Helper function to open a decompressing stream over gzip data.
+    """
+    return GzipFile(fileobj=raw, mode="rb")
+
+
+def _open_zstd(raw):
+    """
+    Helper function to open a decompressing stream over Zstandard data.
+
+    Raises:
+        ImportError: zstandard is not installed.
+    """
+    if ZstdDecompressor is None:
+        raise ImportError("zstandard is required to read Zstandard-compressed data.")
+    return ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+
+
+COMPRESSIONS = {
+    "gzip": (b"\x1f\x8b", _open_gzip),
+    "bz2": (b"BZh", BZ2File),
+    "xz": (b"\xfd7zXZ\x00", LZMAFile),
+    "zstd": (b"\x28\xb5\x2f\xfd", _open_zstd),
+}
+"""
+A dictionary of the compression formats that are decompressed transparently (see `Resource`),
+where the key is the name of the compression format,
+and the value is a pair of the magic bytes at the start of compressed data
+and a function opening a decompressing binary stream over a binary stream of compressed data.
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+
+JSON_BACKENDS = {
+    **{
+        name: module.loads
+        for name, module in (("orjson", orjson), ("simdjson", simdjson), ("ujson", ujson))
+        if module is not None
+    },
+    "json": loads,
+}
+"""
+A dictionary of the installed JSON decoders, fastest first,
+where the key is the name of the backend,
+and the value is a function decoding a JSON document from bytes or text (see `decode_json`).
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+_json_backend = None
+
+
+def set_json_backend(name=None):
+    """
+    Set the JSON backend used when none is given per call (see `decode_json`).
+
+    Args:
+        name (str, optional): A key of `JSON_BACKENDS`. Defaults to the fastest installed backend.
+
+    Raises:
+        ValueError: The JSON backend is not installed.
+    """
+    global _json_backend
+    _check_json_backend(name)
+    _json_backend = name
+
+
+def _check_json_backend(name):
+    """
+    Helper function to check that a user-specified JSON backend is installed.
+
+    Raises:
+        ValueError: The JSON backend is not installed.
+    """
+    if name is not None and name not in JSON_BACKENDS:
+        raise ValueError(f"The JSON backend {name} is not installed.")
+
+
+def decode_json(data, backend=None):
+    """
+    Decode a JSON document, straight from bytes if given bytes.
+
+    Any error of a backend other than the json module falls back to the json module, so the result is always
+    that of `json.loads`: documents that only the json module accepts (e.g. with NaN, integers beyond 64 bits,
+    or text in UTF-16) are decoded by it, and invalid documents raise its errors.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        data (bytes or str): The JSON document.
+        backend (str, optional): A key of `JSON_BACKENDS`.
+            Defaults to the backend set by `set_json_backend`, or else the fastest installed backend.
+
+    Returns:
+        object: The decoded JSON value.
+
+    Raises:
+        ValueError: The JSON document is invalid, or the JSON backend is not installed.
+    """
+    _check_json_backend(backend)
+    decoder = JSON_BACKENDS[backend or _json_backend or next(iter(JSON_BACKENDS))]
+    if decoder is not loads:
+        try:
+            return decoder(data)
+        except Exception:
+            pass  # Decode it with the json module instead
+    return loads(data)
+
 
 @unique
 class Connectivity(Enum):
@@ -52,400 +353,3109 @@ class Connectivity(Enum):
     - `ONLINE_STATIC` = The URL points to a static file on the Internet.
     - `LOCAL` = The URL is a path to a local file.
 
-    For example, at the moment, a data stream from the Internet is not supported.
+    For example, at the moment, a data stream from the Internet is not supported.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+    """
+
+    ONLINE_STATIC = auto()
+    LOCAL = auto()
+
+
+class HTTPCache:
+    """
+    An on-disk store of response bodies, keyed by URL, for responses that carry an `ETag` or `Last-Modified` header.
+
+    A session with a cache (see `PooledSession`) revalidates stored responses with a conditional GET
+    (`If-None-Match`/`If-Modified-Since`) and serves the stored body when the server answers 304 Not Modified,
+    so an unchanged resource only costs a header round-trip.
+    The least recently used entries are evicted to stay within `max_entries` and `max_bytes`.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        directory (str): The directory to store the responses in. It is created if it does not exist.
+        max_bytes (int, optional): The maximum total size of the stored bodies, in bytes.
+        max_entries (int, optional): The maximum number of stored responses.
+    """
+
+    # The response headers that are stored along with a body, to be replayed on 304 Not Modified
+    STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024, max_entries=1024):
+        self.directory = os_path.expanduser(directory)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        makedirs(self.directory, exist_ok=True)
+
+    def _path(self, url, suffix):
+        key = sha256(url.encode("utf-8")).hexdigest()
+        return os_path.join(self.directory, key + suffix)
+
+    def get(self, url):
+        """
+        Get the stored headers for the URL.
+
+        Args:
+            url (str): The URL of a response.
+
+        Returns:
+            dict: The stored headers, or None if there is no stored response for the URL.
+        """
+        try:
+            with open(self._path(url, ".json"), "r") as file_obj:
+                entry = load(file_obj)
+        except (OSError, ValueError):
+            return None
+        if entry.get("url") != url or not os_path.exists(self._path(url, ".body")):
+            return None
+        return entry["headers"]
+
+    def open_body(self, url):
+        """
+        Open the stored body for the URL, marking the response as recently used.
+
+        Args:
+            url (str): The URL of a stored response.
+
+        Returns:
+            io.BufferedReader: A binary file object over the stored body.
+        """
+        body_path = self._path(url, ".body")
+        utime(body_path)  # The modification time of a body is the clock for LRU eviction
+        return open(body_path, "rb")
+
+    def store(self, url, headers, body):
+        """
+        Store a response, evicting the least recently used responses as necessary.
+        Responses without an `ETag` or `Last-Modified` header cannot be revalidated, so they are not stored.
+
+        Args:
+            url (str): The URL of the response.
+            headers (:obj:`Mapping`): The headers of the response.
+            body (bytes): The decoded body of the response.
+
+        Returns:
+            bool: Whether the response was stored.
+        """
+        if "ETag" not in headers and "Last-Modified" not in headers:
+            return False
+        if len(body) > self.max_bytes:
+            return False
+
+        entry = {"url": url, "headers": {name: headers[name] for name in self.STORED_HEADERS if name in headers}}
+        for suffix, mode, data in ((".body", "wb", body), (".json", "w", entry)):
+            # Write to a temporary file first, so that readers never see a partial entry
+            final_path = self._path(url, suffix)
+            with open(final_path + ".tmp", mode) as file_obj:
+                if suffix == ".json":
+                    dump(data, file_obj)
+                else:
+                    file_obj.write(data)
+            replace(final_path + ".tmp", final_path)
+
+        self.evict()
+        return True
+
+    def evict(self):
+        """
+        Remove the least recently used responses until the store is within `max_entries` and `max_bytes`.
+        """
+        bodies = []
+        for name in listdir(self.directory):
+            if name.endswith(".body"):
+                info = stat(os_path.join(self.directory, name))
+                bodies.append((info.st_mtime, info.st_size, name[: -len(".body")]))
+        bodies.sort()
+
+        total_bytes = sum(size for _, size, _ in bodies)
+        while bodies and (len(bodies) > self.max_entries or total_bytes > self.max_bytes):
+            _, size, key = bodies.pop(0)
+            total_bytes -= size
+            for suffix in (".json", ".body"):
+                try:
+                    remove(os_path.join(self.directory, key + suffix))
+                except OSError:
+                    pass
+
+
+class _CachingAdapter(HTTPAdapter):
+    """
+    A transport adapter that revalidates GET requests against an HTTPCache and serves 304 responses from it.
+    """
+
+    def __init__(self, cache, **kwargs):
+        self.cache = cache
+        super().__init__(**kwargs)
+
+    def send(self, request, stream=False, **kwargs):
+        headers = self.cache.get(request.url) if request.method == "GET" else None
+        if headers is not None:
+            if "ETag" in headers:
+                request.headers["If-None-Match"] = headers["ETag"]
+            if "Last-Modified" in headers:
+                request.headers["If-Modified-Since"] = headers["Last-Modified"]
+
+        response = super().send(request, stream=stream, **kwargs)
+        response.from_cache = False
+
+        if headers is not None and response.status_code == 304:
+            # Release the connection, then replay the stored response in place of the empty 304
+            response.raw.drain_conn()
+            response.raw.release_conn()
+            response.raw = self.cache.open_body(request.url)
+            response.status_code = 200
+            response.reason = "OK"
+            response.headers.pop("Content-Encoding", None)  # Stored bodies are already decoded
+            response.headers.pop("Content-Length", None)
+            response.headers.update(headers)
+            response.from_cache = True
+
+        elif request.method == "GET" and response.status_code == 200 and not stream:
+            self.cache.store(request.url, response.headers, response.content)
+
+        return response
+
+
+class PooledSession(Session):
+    """
+    A requests Session that keeps connections to each host alive in a pool, so that repeated fetches
+    from the same hosts skip the TCP and TLS handshakes.
+
+    Failed connections and transient server errors are retried with exponential backoff,
+    every request has a default timeout, and the compressed encodings that urllib3 can decode
+    (gzip and deflate, plus brotli if installed) are negotiated.
+    With an HTTPCache, GET responses are also stored on disk and revalidated (see `HTTPCache`).
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        pool_size (int, optional): The maximum number of connections kept alive per host.
+        retries (int, optional): The maximum number of retries per request.
+        backoff_factor (float, optional): The backoff factor between retries, in seconds.
+        timeout (float, optional): The default connect and read timeout per request, in seconds.
+        cache (:obj:`HTTPCache`, optional): The on-disk store to revalidate GET responses against.
+    """
+
+    def __init__(self, pool_size=10, retries=3, backoff_factor=0.5, timeout=30, cache=None):
+        super().__init__()
+        self.timeout = timeout
+        self.cache = cache
+
+        retry = Retry(total=retries, backoff_factor=backoff_factor, status_forcelist=(429, 500, 502, 503, 504))
+        if cache is None:
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        else:
+            adapter = _CachingAdapter(cache, pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+        self.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+_default_session = None
+
+
+def get_session():
+    """
+    Get the PooledSession shared by all Internet resources that are not given a session of their own.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Returns:
+        PooledSession: The shared session, created on first use.
+    """
+    global _default_session
+    if _default_session is None:
+        _default_session = PooledSession()
+    return _default_session
+
+
+class _ChunkStream(RawIOBase):
+    """
+    A read-only binary stream over an iterator of byte chunks, such as `requests.Response.iter_content`.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._pending:
+            self._pending = next(self._chunks, None)
+            if self._pending is None:
+                self._pending = b""
+                return 0  # EOF
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+class _DecompressStream(RawIOBase):
+    """
+    A read-only binary stream decompressing another binary stream incrementally (see `COMPRESSIONS`),
+    so that only a bounded amount of compressed and decompressed data is held in memory at a time.
+    The other stream is closed along with it.
+    """
+
+    def __init__(self, raw, opener):
+        self._raw = raw
+        self._stream = opener(raw)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self._stream.readinto(buffer)
+
+    def close(self):
+        if not self.closed:
+            self._stream.close()
+            self._raw.close()
+        super().close()
+
+
+class _BufferStream(RawIOBase):
+    """
+    A read-only, seekable binary stream over a buffer such as bytes or an mmap, which reads without copying it whole.
+    """
+
+    def __init__(self, buffer):
+        self._view = memoryview(buffer)
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), len(self._view) - self._pos)
+        buffer[:size] = self._view[self._pos : self._pos + size]
+        self._pos += size
+        return size
+
+    def seek(self, offset, whence=SEEK_SET):
+        base = {SEEK_SET: 0, SEEK_CUR: self._pos, SEEK_END: len(self._view)}[whence]
+        self._pos = max(base + offset, 0)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def close(self):
+        if not self.closed:
+            self._view.release()  # An mmap cannot be closed while views of it exist
+        super().close()
+
+
+def _map_file(path):
+    """
+    Helper function to memory-map a local file for reading.
+
+    Returns:
+        mmap or bytes: The memory map of the file, or empty bytes for an empty file, which cannot be mapped.
+    """
+    with open(path, "rb") as file_obj:
+        try:
+            return mmap(file_obj.fileno(), 0, access=ACCESS_READ)
+        except ValueError:  # An empty file cannot be mapped
+            return b""
+
+
+def _spool(chunks):
+    """
+    Helper function to collect chunks of data, in memory up to `SPOOL_SIZE` bytes and in a temporary file beyond.
+
+    Returns:
+        bytes or mmap: The data, or a memory map of the temporary file (which is deleted once the map is closed).
+    """
+    chunks = iter(chunks)
+    buffered, size = [], 0
+    for chunk in chunks:
+        buffered.append(chunk)
+        size += len(chunk)
+        if size > SPOOL_SIZE:
+            break
+    else:
+        return b"".join(buffered)
+
+    with TemporaryFile() as file_obj:
+        file_obj.writelines(buffered)
+        del buffered
+        for chunk in chunks:
+            file_obj.write(chunk)
+        file_obj.flush()
+        return mmap(file_obj.fileno(), 0, access=ACCESS_READ)
+
+
+class Resource:
+    """
+    The Resource class stores some metadata about the resource to simplify the code.
+
+    The resource data is held as raw bytes in `content`: local files are memory-mapped rather than read,
+    and Internet resources hold the body of the response. Sniffing, parsing and streams all read from that
+    one buffer, and it is only decoded into `plaintext` if a conversion needs the whole text.
+
+    Compressed data (see `COMPRESSIONS`) is recognized by its magic bytes and decompressed transparently:
+    the compressed bytes are held in `raw` instead, `content` is None, and `head`, `open_binary` and `open_text`
+    decompress incrementally, so the decompressed data is never held in memory in full.
+
+    With `stream=True`, the resource data is not read up front,
+    so that it can be consumed in constant memory through `open_binary` and `open_text`,
+    or inspected through `head` before the rest is read with `load`.
+
+    Internet resources are fetched through the given requests Session,
+    or through the shared PooledSession (see `get_session`) by default.
+    The body is downloaded in chunks and, if it is larger than `SPOOL_SIZE`, spooled to a temporary file
+    that is memory-mapped as a local file is. If the connection drops, the download resumes from the last byte
+    received with an HTTP Range request, provided the server accepts ranges and the response has a validator.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+    """
+
+    def __init__(self, url, connectivity, stream=False, session=None):
+        url = url.replace("file://", "")
+        self.url = url
+        self.connectivity = connectivity
+        self.stream = stream
+        self.raw = None
+        self.content = None
+        self.compression = None
+        self.response = None
+        self.encoding = None  # The locale's preferred encoding for local files, as for open()
+        self._plaintext = None
+        if session is None and connectivity == Connectivity.ONLINE_STATIC:
+            session = get_session()
+        self._session = session
+        self._range_response = None
+
+        if connectivity == Connectivity.ONLINE_STATIC:
+            response = session.get(url, stream=True)
+            self.response = response
+            # requests assumes ISO-8859-1 for text/* without a charset, which is rarely right for data files
+            charset = "charset" in response.headers.get("Content-Type", "").lower()
+            self.encoding = response.encoding if charset else "utf-8"
+            # Nothing is read up front; the data is pulled through `head`, `open_binary` and `load` on demand
+            self._prefix_chunks = []
+            self._chunks = self._iter_chunks()
+
+        elif connectivity == Connectivity.LOCAL and not stream:
+            self.raw = _map_file(url)
+
+        magic = self._raw_head(max(len(signature) for signature, _ in COMPRESSIONS.values()))
+        for name, (signature, _) in COMPRESSIONS.items():
+            if magic.startswith(signature):
+                self.compression = name
+                break
+        if self.compression is None:
+            self.content = self.raw
+
+        # Parsed artifacts, keyed by input type, so that each input type is parsed at most once
+        self.parsed = {}
+
+        if connectivity == Connectivity.ONLINE_STATIC and not stream:
+            self.load()
+
+    @property
+    def plaintext(self):
+        """
+        str: The resource data decoded as text, or None if it is not text (e.g. XLSX data) or is streamed.
+        The data is decoded (and decompressed) on first access.
+        """
+        if self._plaintext is None and self.raw is not None:
+            if self.content is None:
+                with self.open_binary() as data:
+                    content = data.read()
+            else:
+                content = self.content[:]
+            try:
+                self._plaintext = content.decode(self.encoding or getpreferredencoding(False))
+            except UnicodeDecodeError:
+                if self.connectivity == Connectivity.ONLINE_STATIC and self.compression is None:
+                    self._plaintext = self.response.text  # Fall back to the encoding detection of requests
+        return self._plaintext
+
+    def head(self, size=SNIFF_SIZE):
+        """
+        Get a bounded prefix of the resource data without decoding it.
+
+        Compressed data is decompressed only as far as the prefix reaches.
+
+        Args:
+            size (int, optional): The maximum number of bytes to return.
+
+        Returns:
+            bytes: At most `size` bytes from the start of the resource.
+        """
+        if self.compression is None:
+            return self._raw_head(size)
+
+        decompressor = COMPRESSIONS[self.compression][1]
+        with BufferedReader(_DecompressStream(self._open_raw(replay=True), decompressor), CHUNK_SIZE) as data:
+            return data.read(size)
+
+    def _raw_head(self, size):
+        """
+        Helper method to get a bounded prefix of the raw (possibly compressed) resource data.
+        """
+        if self.raw is not None:
+            return self.raw[:size]
+
+        if self.connectivity == Connectivity.ONLINE_STATIC:
+            # Hold on to the chunks read so far, so that `open_binary` can replay them
+            buffered = sum(len(chunk) for chunk in self._prefix_chunks)
+            for chunk in self._chunks:
+                self._prefix_chunks.append(chunk)
+                buffered += len(chunk)
+                if buffered >= size:
+                    break
+            return b"".join(self._prefix_chunks)[:size]
+
+        with open(self.url, "rb") as file_obj:
+            return file_obj.read(size)
+
+    def open_binary(self):
+        """
+        Open a binary stream over the resource data, decompressing it incrementally if it is compressed.
+
+        For a streamed Internet resource, the stream continues the HTTP response,
+        so it can only be opened once.
+
+        Returns:
+            io.BufferedIOBase: A binary stream positioned at the start of the resource.
+        """
+        raw = self._open_raw()
+        if self.compression is None:
+            return raw
+        return BufferedReader(_DecompressStream(raw, COMPRESSIONS[self.compression][1]), CHUNK_SIZE)
+
+    def _open_raw(self, replay=False):
+        """
+        Helper method to open a binary stream over the raw (possibly compressed) resource data.
+
+        With `replay=True`, the chunks of a streamed Internet resource that are read are held on to,
+        so that a later stream can read them again (as for `head`).
+        """
+        if self.raw is not None:
+            return BufferedReader(_BufferStream(self.raw), CHUNK_SIZE)
+        if self.connectivity == Connectivity.LOCAL:
+            return open(self.url, "rb")
+        if replay:
+            return BufferedReader(_ChunkStream(self._replay_chunks()), CHUNK_SIZE)
+        return BufferedReader(_ChunkStream(chain(self._prefix_chunks, self._chunks)), CHUNK_SIZE)
+
+    def load(self):
+        """
+        Read the rest of the resource data into `raw`, if the resource was retrieved with `stream=True`.
+
+        The chunks of an Internet resource that were already read (e.g. by `head`) are not fetched again,
+        so a prefix can be inspected first and the rest only downloaded once the resource is known to be convertible.
+        A local file is memory-mapped. The resource then behaves as if it was retrieved without streaming.
+
+        With an HTTPCache on the session (see `PooledSession`), the downloaded response is stored in it,
+        as the caching adapter cannot store a response that it does not read itself.
+        """
+        if self.raw is not None:
+            return
+
+        if self.connectivity == Connectivity.ONLINE_STATIC:
+            self.raw = _spool(chain(self._prefix_chunks, self._chunks))
+            self._prefix_chunks, self._chunks = [], ()
+            response = self.response
+            response._content = self.raw  # So that `response.text` can decode the body, as for a response read in full
+            cache = getattr(self._session, "cache", None)
+            if (
+                isinstance(cache, HTTPCache)
+                and response.status_code == 200
+                and not getattr(response, "from_cache", True)
+            ):
+                cache.store(response.url, response.headers, self.raw)
+        else:
+            self.raw = _map_file(self.url)
+
+        self.stream = False
+        if self.compression is None:
+            self.content = self.raw
+
+    def _iter_chunks(self):
+        """
+        Helper method to iterate over the chunks of the body of an Internet resource,
+        resuming the download from the last byte received if the connection drops (see `MAX_RESUMES`).
+        """
+        response, offset, resumes = self.response, 0, 0
+        while True:
+            try:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    offset += len(chunk)
+                    yield chunk
+                return
+            except (ChunkedEncodingError, RequestsConnectionError):
+                if resumes == MAX_RESUMES:
+                    raise
+                resumes += 1
+                response = self._request_range(offset)
+                if response is None:
+                    raise
+
+    def _request_range(self, offset):
+        """
+        Helper method to request the body of an Internet resource from an offset onwards.
+
+        Only a response to the same version of the resource is accepted: the original response must have a validator
+        (`ETag` or `Last-Modified`) for the `If-Range` header, and must be neither encoded nor replayed from a cache,
+        so that offsets into the decoded body are offsets into the body on the server.
+
+        Returns:
+            requests.Response: The partial response, or None if the download cannot be resumed.
+        """
+        headers = self.response.headers
+        validator = headers.get("ETag") or headers.get("Last-Modified")
+        resumable = (
+            headers.get("Accept-Ranges") == "bytes" and headers.get("Content-Encoding", "identity") == "identity"
+        )
+        if validator is None or not resumable or getattr(self.response, "from_cache", False):
+            return None
+
+        if self._range_response is not None:
+            self._range_response.close()
+        response = self._session.get(
+            self.response.url, headers={"Range": f"bytes={offset}-", "If-Range": validator}, stream=True
+        )
+        self._range_response = response
+        if response.status_code != 206 or not response.headers.get("Content-Range", "").startswith(f"bytes {offset}-"):
+            return None  # The server sent the whole (possibly changed) resource instead
+        return response
+
+    def _replay_chunks(self):
+        """
+        Helper method to iterate over the chunks of a streamed Internet resource, holding on to those that are read.
+        """
+        yield from list(self._prefix_chunks)
+        for chunk in self._chunks:
+            self._prefix_chunks.append(chunk)
+            yield chunk
+
+    def open_text(self):
+        """
+        Open a text stream over the resource data, decoded incrementally and with newlines untranslated
+        (as the csv module expects).
+
+        Returns:
+            io.TextIOWrapper: A text stream positioned at the start of the resource.
+        """
+        return TextIOWrapper(self.open_binary(), encoding=self.encoding, newline="")
+
+    def close(self):
+        """
+        Release the memory map or HTTP connection held by the resource, if any.
+        """
+        if self.response is not None:
+            self.response.close()
+        if self._range_response is not None:
+            self._range_response.close()
+        if isinstance(self.raw, mmap):
+            try:
+                self.raw.close()
+            except BufferError:
+                pass  # A stream over the map is still open; the map is released once it is collected
+
+    def parse(self, key, **options):
+        """
+        Parse the resource as an input type, reusing the result of any previous parse.
+
+        A failed parse is remembered as well, so that it is not attempted again.
+
+        Args:
+            key (:obj:`InputType` or tuple): An attribute in the enumeration `InputType`,
+                or an (input type, representation) pair (see `PARSERS`).
+            **options: Keyword options of the parser, which only apply if the key has not been parsed yet
+                (e.g. the JSON backend, which does not change the parsed artifact).
+
+        Returns:
+            object: The parsed artifact for the key (see `PARSERS`).
+        """
+        if key not in self.parsed:
+            try:
+                self.parsed[key] = PARSERS[key](self, **options)
+            except Exception as e:
+                self.parsed[key] = e
+
+        artifact = self.parsed[key]
+        if isinstance(artifact, Exception):
+            raise artifact
+        return artifact
+
+    def __getstate__(self):
+        # Memory maps, sessions and open downloads cannot be sent to another process (as by `from_urls`),
+        # so a downloaded resource is sent with its data as bytes
+        state = dict(self.__dict__, _session=None, _range_response=None, _prefix_chunks=[], _chunks=())
+        if isinstance(self.raw, mmap):
+            state["raw"] = self.raw[:]
+            state["content"] = state["raw"] if self.compression is None else None
+            if self.response is not None:
+                state["response"] = copy(self.response)
+                state["response"]._content = state["raw"]
+        return state
+
+    def __eq__(self, other):
+        # For Internet resources,
+        # Resource.response may have stochastic attributes like time elapsed.
+        # URL, connectivity type, plaintext should be enough to determine different Resources.
+        return self.url == other.url and self.connectivity == other.connectivity and self.plaintext == other.plaintext
+
+
+def url_to_connectivity(url):
+    """
+    Get the connectivity type of the resource.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        url (str): The URL to a resource.
+
+    Returns:
+        Connectivity: An attribute in the enumeration `Connectivity`. The calculated connectivity of the resource type.
+    """
+    local_conditions = [url.startswith("file:///"), url.startswith("/"), url.startswith(".")]
+    if any(local_conditions):
+        return Connectivity.LOCAL
+    else:
+        return Connectivity.ONLINE_STATIC
+
+
+def retrieve_resource(url, connectivity, stream=False, session=None):
+    """
+    Retrieves the resource at the URL using the connectivity type and stores it in a Resource object.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        url (str): The URL to a resource.
+        connectivity (:obj:`Connectivity`): An attribute in the enumeration Connectivity.
+            The calculated connectivity type of the resource.
+        stream (bool, optional): Whether to defer reading the resource data (see `Resource`).
+        session (:obj:`requests.Session`, optional): The session to fetch Internet resources through.
+            Defaults to the shared PooledSession (see `get_session`).
+
+    Returns:
+        Resource: The Resource object for the resource at the URL specified.
+
+    Raises:
+        TypeError: The connectivity type is not supported.
+    """
+    if not isinstance(connectivity, Connectivity):
+        raise TypeError(f"The connectivity type {connectivity} is not supported.")
+
+    return Resource(url, connectivity, stream=stream, session=session)
+
+
+def _sniff_json(prefix, text, truncated):
+    """
+    Helper function to score how likely a prefix is to be JSON data.
+    A leading string, number, `true`, `false` or `null` may be a scalar JSON document, but is only weak evidence.
+    """
+    if text[:1] in ("{", "["):
+        return 0.9
+    if text[:1] and text[:1] in '"-0123456789tfn':
+        return 0.1
+    return 0.0
+
+
+def _sniff_ndjson(prefix, text, truncated):
+    """
+    Helper function to score how likely a prefix is to be NDJSON (JSON Lines) data,
+    where each of the first `SNIFF_LINES` lines must hold exactly one JSON value.
+    """
+    if text[:1] not in ("{", "["):
+        return 0.0
+
+    lines = [line for line in text.splitlines()[: SNIFF_LINES + 1] if line.strip()]
+    if truncated and len(lines) <= SNIFF_LINES:
+        lines = lines[:-1]  # The last line may have been cut off by the prefix boundary
+        if not lines:
+            return 0.1  # The first record is longer than the prefix, so only conversion can tell
+
+    try:
+        for line in lines:
+            decode_json(line)
+    except ValueError:
+        return 0.0
+
+    if len(lines) > 1:
+        return 0.95  # A JSON document cannot hold more than one top-level value
+    if len(lines) == 1:
+        return 0.5  # A single line of JSON is as much a JSON document as it is NDJSON
+    return 0.0
+
+
+def _sniff_delimited(text, truncated, delimiter):
+    """
+    Helper function to score how likely a prefix is to be delimited data,
+    based on the field counts of the first `SNIFF_LINES` records.
+    """
+    rows = reader(StringIO(text), delimiter=delimiter)
+    try:
+        records = [row for row in islice(rows, SNIFF_LINES + 1) if row]
+        exhausted = next(rows, None) is None
+    except CSVError:
+        return 0.0
+
+    if truncated and exhausted:
+        records = records[:-1]  # The last record may have been cut off by the prefix boundary
+
+    if len(records) < 2:
+        return 0.0  # There must be a header and at least one row of data
+
+    header, *data = records
+    # Data that have only one column will not be interpreted as delimited data
+    if len(header) < 2 or any(len(row) > len(header) for row in data):
+        return 0.0
+
+    # Ragged rows are tolerated (as DictReader does), but are less convincing
+    return 0.6 * sum(len(row) == len(header) for row in data) / len(data)
+
+
+def _sniff_csv(prefix, text, truncated):
+    """
+    Helper function to score how likely a prefix is to be CSV data.
+    """
+    return _sniff_delimited(text, truncated, ",")
+
+
+def _sniff_tsv(prefix, text, truncated):
+    """
+    Helper function to score how likely a prefix is to be TSV data.
+    """
+    return _sniff_delimited(text, truncated, "\t")
+
+
+def _sniff_xml(prefix, text, truncated):
+    """
+    Helper function to score how likely a prefix is to be XML data.
+    """
+    if text.startswith("<?xml"):
+        return 1.0
+    if text[:1] == "<":
+        return 0.9
+    return 0.0
+
+
+def _sniff_xlsx(prefix, text, truncated):
+    """
+    Helper function to score how likely a prefix is to be XLSX data.
+    """
+    if prefix.startswith(XLSX_SIGNATURE):
+        return 1.0
+    return 0.0
+
+
+def _sniff_parquet(prefix, text, truncated):
+    """
+    Helper function to score how likely a prefix is to be Parquet data.
+    """
+    if prefix.startswith(PARQUET_SIGNATURE):
+        return 1.0
+    return 0.0
+
+
+def _sniff_arrow(prefix, text, truncated):
+    """
+    Helper function to score how likely a prefix is to be Arrow IPC data, in the file or the stream format.
+    """
+    if prefix.startswith(ARROW_SIGNATURE):
+        return 1.0
+    if prefix.startswith(ARROW_STREAM_SIGNATURE) and len(prefix) >= 8:
+        return 0.8  # The continuation marker is followed by the length of the schema message
+    return 0.0
+
+
+SNIFFERS = {
+    InputType.JSON: _sniff_json,
+    InputType.CSV: _sniff_csv,
+    InputType.TSV: _sniff_tsv,
+    InputType.XML: _sniff_xml,
+    InputType.XLSX: _sniff_xlsx,
+    InputType.NDJSON: _sniff_ndjson,
+    InputType.PARQUET: _sniff_parquet,
+    InputType.ARROW: _sniff_arrow,
+}
+"""
+A dictionary of cheap format probes,
+where the key is a supported input type,
+and the value is a function scoring a resource prefix from 0 (impossible) to 1 (certain).
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+SNIFF_COSTS = {
+    InputType.XLSX: 0,
+    InputType.PARQUET: 0,
+    InputType.ARROW: 0,
+    InputType.JSON: 1,
+    InputType.XML: 1,
+    InputType.CSV: 2,
+    InputType.TSV: 2,
+    InputType.NDJSON: 3,
+}
+"""
+A dictionary of the relative costs of the format probes,
+where the key is a supported input type,
+and the value is a number; cheaper probes are run first (see `sniff`). Input types not listed have a cost of 1.
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+SNIFF_PRIORITIES = {}
+"""
+A dictionary of tie-breaking priorities of the format probes,
+where the key is a supported input type,
+and the value is a number; of two equally likely input types, the one with the higher priority is ranked first.
+Input types not listed have a priority of 0, and ties in priority are broken by the order of `SNIFFERS`.
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+SNIFF_CERTAIN = 1.0
+"""
+The score at which a format probe is certain of the input type, and no further probes are run (see `sniff`).
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+EXTENSIONS = {
+    ".json": InputType.JSON,
+    ".csv": InputType.CSV,
+    ".tsv": InputType.TSV,
+    ".tab": InputType.TSV,
+    ".xml": InputType.XML,
+    ".xlsx": InputType.XLSX,
+    ".ndjson": InputType.NDJSON,
+    ".jsonl": InputType.NDJSON,
+    ".parquet": InputType.PARQUET,
+    ".arrow": InputType.ARROW,
+    ".arrows": InputType.ARROW,
+    ".feather": InputType.ARROW,
+}
+"""
+A dictionary of file extensions that suggest an input type (see `guess_input_type`),
+where the key is a lowercase file extension,
+and the value is the suggested input type.
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+CONTENT_TYPES = {
+    "application/json": InputType.JSON,
+    "text/json": InputType.JSON,
+    "text/csv": InputType.CSV,
+    "application/csv": InputType.CSV,
+    "text/tab-separated-values": InputType.TSV,
+    "application/xml": InputType.XML,
+    "text/xml": InputType.XML,
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": InputType.XLSX,
+    "application/x-ndjson": InputType.NDJSON,
+    "application/ndjson": InputType.NDJSON,
+    "application/jsonl": InputType.NDJSON,
+    "application/x-jsonlines": InputType.NDJSON,
+    "application/vnd.apache.parquet": InputType.PARQUET,
+    "application/x-parquet": InputType.PARQUET,
+    "application/vnd.apache.arrow.file": InputType.ARROW,
+    "application/vnd.apache.arrow.stream": InputType.ARROW,
+}
+"""
+A dictionary of media types that suggest an input type for Internet resources (see `guess_input_type`),
+where the key is a lowercase media type (the Content-Type header without its parameters),
+and the value is the suggested input type.
+Media types with a structured syntax suffix (e.g. `application/geo+json`) suggest the input type of the suffix,
+and ambiguous media types such as `text/plain` or `application/octet-stream` suggest nothing.
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+STRUCTURED_SUFFIXES = {
+    "+json": InputType.JSON,
+    "+xml": InputType.XML,
+}
+"""
+A dictionary of the structured syntax suffixes of media types (see `CONTENT_TYPES`),
+where the key is a suffix,
+and the value is the suggested input type.
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+COMPRESSION_EXTENSIONS = (".gz", ".bz2", ".xz", ".zst")
+"""
+The file extensions of compressed files, which are looked past to the extension of the data (e.g. `.csv.gz`).
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+
+def sniff(prefix, truncated=True, in_types=None):
+    """
+    Rank the possible input types of a resource from a bounded prefix of its raw data.
+
+    Only magic bytes, the leading character and delimiter statistics are inspected,
+    so the cost does not depend on the size of the resource.
+    The probes are run from the cheapest to the most expensive (see `SNIFF_COSTS`),
+    and no further probes are run once one of them is certain of the input type (see `SNIFF_CERTAIN`).
+    Format plugins are loaded on the first call (see `load_plugins`).
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        prefix (bytes): The first bytes of the resource.
+        truncated (bool, optional): Whether the resource may continue past the prefix.
+        in_types (:obj:`Iterable`, optional): The input types to run the probes of. Defaults to every input type.
+
+    Returns:
+        list: A list of possible input types, with the most likely input type first.
+    """
+    load_plugins()
+    text = prefix.decode("utf-8", errors="replace").lstrip("\ufeff \t\r\n")
+
+    # Sorting is stable, so probes of equal cost are run in the order of SNIFFERS
+    order = {in_type: position for position, in_type in enumerate(SNIFFERS)}
+    scores = {}
+    probes = SNIFFERS if in_types is None else [in_type for in_type in SNIFFERS if in_type in in_types]
+    for in_type in sorted(probes, key=lambda in_type: SNIFF_COSTS.get(in_type, 1)):
+        score = SNIFFERS[in_type](prefix, text, truncated)
+        if score > 0:
+            scores[in_type] = score
+        if score >= SNIFF_CERTAIN:
+            break
+
+    def rank(in_type):
+        return (-scores[in_type], -SNIFF_PRIORITIES.get(in_type, 0), order[in_type])
+
+    return sorted(scores, key=rank)
+
+
+def get_resource_types(resource):
+    """
+    Get possible resource types of the resource, with the most likely resource type first.
+
+    Only a bounded prefix of the resource is inspected (see `sniff`),
+    so that only the most likely resource type is ever fully parsed by `convert`.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the resource.
+
+    Returns:
+        list: A list of possible resource types of the resource.
+
+    Raises:
+        TypeError: The resource is of a type that is not supported.
+    """
+    prefix = resource.head(SNIFF_SIZE)
+    possible = sniff(prefix, truncated=len(prefix) >= SNIFF_SIZE)
+
+    if len(possible) == 0:
+        raise TypeError("The type of the resource is not supported.")
+
+    return possible
+
+
+def guess_input_type(resource):
+    """
+    Guess the input type of the resource from its metadata, without reading its data:
+    the Content-Type header of an Internet resource (see `CONTENT_TYPES`),
+    or else the file extension of its URL (see `EXTENSIONS`), after any redirects.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the resource.
+
+    Returns:
+        InputType: The input type suggested by the metadata, or None.
+    """
+    path = resource.url
+    if resource.response is not None:
+        media_type = resource.response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if media_type in CONTENT_TYPES:
+            return CONTENT_TYPES[media_type]
+        for suffix, in_type in STRUCTURED_SUFFIXES.items():
+            if media_type.endswith(suffix):
+                return in_type
+        path = urlsplit(resource.response.url or resource.url).path  # The final URL, after any redirects
+
+    root, extension = os_path.splitext(path.lower())
+    if extension in COMPRESSION_EXTENSIONS:
+        root, extension = os_path.splitext(root)
+    return EXTENSIONS.get(extension)
+
+
+def hint_resource_types(resource, in_type=None):
+    """
+    Get the input type of the resource without running every format probe, if it can be told cheaply.
+
+    An input type given by the user is trusted as is. Otherwise, an input type suggested by the Content-Type header
+    or the file extension (see `guess_input_type`) is only accepted if its own format probe accepts a prefix
+    of the resource, as servers and file names do not always tell the truth.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the resource.
+        in_type (:obj:`InputType`, optional): The user-specified input type of the resource.
+
+    Returns:
+        list: A list of the hinted input type, or None if the input type must be determined by `get_resource_types`.
+    """
+    if in_type is not None:
+        return [in_type]
+
+    guess = guess_input_type(resource)
+    if guess is None or guess not in SNIFFERS:
+        return None
+    prefix = resource.head(SNIFF_SIZE)
+    return sniff(prefix, truncated=len(prefix) >= SNIFF_SIZE, in_types=[guess]) or None
+
+
+def _check_in_type(in_type):
+    """
+    Helper function to check that a user-specified input type is supported.
+
+    Raises:
+        TypeError: The input type is not supported.
+    """
+    load_plugins()
+    if in_type is not None and in_type not in CONVERSIONS:
+        raise TypeError(f"The specified input type {in_type} is not supported.")
+
+
+def get_conversions(in_types, out_type=None):
+    """
+    Get possible conversions for the probable resource types.
+    If the user specified a preferred output type, filter out any undesirable conversions to consider.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        in_types (:obj:`list`): A list of calculated possible resource types.
+        out_type (:obj:`class`, optional): The user-specified data type of the output.
+
+    Returns:
+        list: A list of (in, out) conversion tuples as described above.
+    Raises:
+        TypeError: There are no possible conversions.
+    """
+
+    # There is guaranteed at least one probable in_type
+    # Go through each probable resource data type.
+    # Use lists to preserve order.
+    conversions = []  # To make a list of possible conversions.
+    poss_out_types = []  # To make list of all output types based on probable input types.
+    for in_type in in_types:
+        for poss_out_type in CONVERSIONS[in_type]:
+            if out_type is None:
+                if (in_type, poss_out_type) not in conversions:
+                    conversions.append((in_type, poss_out_type))
+                if poss_out_type not in poss_out_types:
+                    poss_out_types.append(poss_out_type)
+            elif poss_out_type is out_type:  # (and user specified a preferred output type)
+                if (in_type, poss_out_type) not in conversions:
+                    conversions.append((in_type, poss_out_type))
+                if poss_out_type not in poss_out_types:
+                    poss_out_types.append(poss_out_type)
+    if out_type is not None and out_type not in poss_out_types:
+        raise TypeError(f"The resource cannot be converted into the requested data type {out_type}.")
+
+    return conversions
+
+
+def _parse_json(resource, backend=None):
+    """
+    Helper function to decode JSON data, with a backend of `JSON_BACKENDS` (see `decode_json`).
+    """
+    if resource.content is None:  # Compressed data is decoded through the decompressor
+        with resource.open_binary() as data:
+            return decode_json(data.read(), backend)
+    return decode_json(resource.content[:], backend)  # Decoded straight from the bytes, without a text copy
+
+
+def _parse_ndjson(resource, backend=None):
+    """
+    Helper function to decode NDJSON (JSON Lines) data, skipping blank lines,
+    with a backend of `JSON_BACKENDS` (see `decode_json`).
+    """
+    with resource.open_binary() as data:
+        return [decode_json(line, backend) for line in data if line.strip()]
+
+
+def _parse_csv(resource):
+    """
+    Helper function to read the rows of CSV data.
+    """
+    with resource.open_text() as text:
+        return list(DictReader(text))
+
+
+def _parse_tsv(resource):
+    """
+    Helper function to read the rows of TSV data.
+    """
+    with resource.open_text() as text:
+        return list(DictReader(text, delimiter="\t"))
+
+
+def _parse_delimited_rows(resource, delimiter):
+    """
+    Helper function to read delimited data into compact rows, skipping blank lines as DictReader does.
+    """
+    with resource.open_text() as text:
+        rows = (row for row in reader(text, delimiter=delimiter) if row)
+        header = next(rows, None)
+        if header is None:
+            raise ValueError("The delimited data has no header.")
+        return Rows(header, rows)
+
+
+def _parse_delimited_frame(resource, delimiter):
+    """
+    Helper function to read delimited data into a pandas DataFrame with the vectorized C parser,
+    inferring a type for each column.
+    """
+    # The C parser works through large inputs in internal chunks (low_memory), so the raw rows are never all in memory
+    with resource.open_binary() as data:
+        return read_csv(data, sep=delimiter, engine="c", encoding=resource.encoding, low_memory=True)
+
+
+def _parse_csv_frame(resource):
+    """
+    Helper function to read CSV data into a pandas DataFrame.
+    """
+    return _parse_delimited_frame(resource, ",")
+
+
+def _parse_tsv_frame(resource):
+    """
+    Helper function to read TSV data into a pandas DataFrame.
+    """
+    return _parse_delimited_frame(resource, "\t")
+
+
+def _parse_xml(resource):
+    """
+    Helper function to parse XML data.
+    """
+    with resource.open_binary() as data:
+        return parse(data)
+
+
+def _parse_xlsx(resource):
+    """
+    Helper function to read every sheet of XLSX data into pandas DataFrames.
+    """
+    with resource.open_binary() as data:
+        if not data.seekable():
+            data = BytesIO(data.read())  # The directory of a ZIP archive is at its end
+        return read_excel(data, sheet_name=None)
+
+
+PARSERS = {
+    InputType.JSON: _parse_json,
+    InputType.CSV: _parse_csv,
+    InputType.TSV: _parse_tsv,
+    InputType.XML: _parse_xml,
+    InputType.XLSX: _parse_xlsx,
+    InputType.NDJSON: _parse_ndjson,
+    (InputType.CSV, DataFrame): _parse_csv_frame,
+    (InputType.TSV, DataFrame): _parse_tsv_frame,
+    (InputType.CSV, Rows): partial(_parse_delimited_rows, delimiter=","),
+    (InputType.TSV, Rows): partial(_parse_delimited_rows, delimiter="\t"),
+}
+"""
+A dictionary of parsers,
+where the key is a supported input type (or, for input types that can be parsed in more than one way,
+an (input type, representation) pair),
+and the value is a function producing the parsed artifact that conversions from that input type share.
+Parsed artifacts are cached on the Resource object (see `Resource.parse`).
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+
+def json_to_list(resource, json_backend=None):
+    """
+    Helper function to convert JSON data to a list.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the JSON resource.
+        json_backend (str, optional): The key of `JSON_BACKENDS` to decode with (see `decode_json`).
+
+    Returns:
+        list: A list represenation of the JSON resource.
+    """
+    json = resource.parse(InputType.JSON, backend=json_backend)
+    if type(json) is dict:
+        return [json]
+    return json
+
+
+def json_to_dict(resource, json_backend=None):
+    """
+    Helper function to convert JSON data to a dictionary.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the JSON resource.
+        json_backend (str, optional): The key of `JSON_BACKENDS` to decode with (see `decode_json`).
+
+    Returns:
+        dict: A dictionary represenation of the JSON resource.
+    """
+    json = resource.parse(InputType.JSON, backend=json_backend)
+    if type(json) is list:
+        return {"data": json}
+    return json
+
+
+def json_to_dataframe(resource, json_backend=None):
+    """
+    Helper function to convert JSON data to a pandas DataFrame.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the JSON resource.
+        json_backend (str, optional): The key of `JSON_BACKENDS` to decode with (see `decode_json`).
+
+    Returns:
+        pandas.DataFrame: A pandas DataFrame represenation of the JSON resource.
+    """
+    json = resource.parse(InputType.JSON, backend=json_backend)
+    df = json_normalize(json)
+    return df
+
+
+def ndjson_to_list(resource, json_backend=None):
+    """
+    Helper function to convert NDJSON data to a list.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the NDJSON resource.
+        json_backend (str, optional): The key of `JSON_BACKENDS` to decode with (see `decode_json`).
+
+    Returns:
+        list: A list of the JSON values on each line of the NDJSON resource.
+    """
+    return resource.parse(InputType.NDJSON, backend=json_backend)
+
+
+def ndjson_to_dataframe(resource, json_backend=None):
+    """
+    Helper function to convert NDJSON data to a pandas DataFrame.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the NDJSON resource.
+        json_backend (str, optional): The key of `JSON_BACKENDS` to decode with (see `decode_json`).
+
+    Returns:
+        pandas.DataFrame: A pandas DataFrame represenation of the NDJSON resource.
+    """
+    json = resource.parse(InputType.NDJSON, backend=json_backend)
+    df = json_normalize(json)
+    return df
+
+
+def csv_to_list(resource):
+    """
+    Helper function to convert CSV data to a list.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the CSV resource.
+
+    Returns:
+        list: A list represenation of the CSV resource.
+    """
+    return resource.parse(InputType.CSV)
+
+
+def tsv_to_list(resource):
+    """
+    Helper function to convert TSV data to a list.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the TSV resource.
+
+    Returns:
+        list: A list represenation of the TSV resource.
+    """
+    return resource.parse(InputType.TSV)
+
+
+def csv_to_dataframe(resource):
+    """
+    Helper function to convert CSV data to a pandas DataFrame, with a type inferred for each column.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the CSV resource.
+
+    Returns:
+        pandas.DataFrame: A pandas DataFrame represenation of the CSV resource.
+    """
+    return resource.parse((InputType.CSV, DataFrame))
+
+
+def csv_to_dict(resource):
+    """
+    Helper function to convert CSV data to a column-oriented dictionary.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the CSV resource.
+
+    Returns:
+        dict: A dictionary from each column name to a numpy array of the column,
+            with numeric columns stored as contiguous arrays of their inferred type.
+    """
+    df = resource.parse((InputType.CSV, DataFrame))
+    return {name: column.to_numpy() for name, column in df.items()}
+
+
+def csv_to_rows(resource):
+    """
+    Helper function to convert CSV data to a list of compact rows.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the CSV resource.
+
+    Returns:
+        Rows: A list of compact rows (see `Row`) of the CSV resource.
+    """
+    return resource.parse((InputType.CSV, Rows))
+
+
+def tsv_to_dataframe(resource):
+    """
+    Helper function to convert TSV data to a pandas DataFrame, with a type inferred for each column.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the TSV resource.
+
+    Returns:
+        pandas.DataFrame: A pandas DataFrame represenation of the TSV resource.
+    """
+    return resource.parse((InputType.TSV, DataFrame))
+
+
+def tsv_to_dict(resource):
+    """
+    Helper function to convert TSV data to a column-oriented dictionary.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the TSV resource.
+
+    Returns:
+        dict: A dictionary from each column name to a numpy array of the column,
+            with numeric columns stored as contiguous arrays of their inferred type.
+    """
+    df = resource.parse((InputType.TSV, DataFrame))
+    return {name: column.to_numpy() for name, column in df.items()}
+
+
+def tsv_to_rows(resource):
+    """
+    Helper function to convert TSV data to a list of compact rows.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the TSV resource.
+
+    Returns:
+        Rows: A list of compact rows (see `Row`) of the TSV resource.
+    """
+    return resource.parse((InputType.TSV, Rows))
+
+
+def xml_to_dict(resource):
+    """
+    Helper function to convert XML data to a dictionary.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the XML resource.
+
+    Returns:
+        dict: A dictionary represenation of the XML resource.
+    """
+    rows = resource.parse(InputType.XML)
+    return rows
+
+
+class LazySheets(Mapping):
+    """
+    A read-only dictionary of the sheets of XLSX data, where each sheet is only parsed when it is first accessed.
+
+    The workbook is opened in openpyxl's read-only mode, so listing the sheets does not parse any of them.
+
+    Args:
+        source (str or file-like): The path to, or a seekable binary stream over, the XLSX data.
+        sheets (list, optional): The names of the sheets to include. Defaults to every sheet.
+
+    Raises:
+        KeyError: A sheet name is not in the workbook.
+    """
+
+    def __init__(self, source, sheets=None):
+        self._excel = ExcelFile(source, engine="openpyxl")
+        names = self._excel.sheet_names
+        if sheets is not None:
+            missing = [name for name in sheets if name not in names]
+            if missing:
+                raise KeyError(f"The sheets {missing} are not in the workbook.")
+            names = [name for name in names if name in sheets]
+        self._names = names
+        self._sheets = {}
+
+    def __getitem__(self, name):
+        if name not in self._names:
+            raise KeyError(name)
+        if name not in self._sheets:
+            self._sheets[name] = self._excel.parse(name).to_dict()
+        return self._sheets[name]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __repr__(self):
+        return f"LazySheets({self._names!r})"
+
+    def close(self):
+        """
+        Close the workbook. Sheets that have already been accessed remain available.
+        """
+        self._excel.close()
+
+
+def xlsx_to_dict(resource, sheets=None, lazy=False):
+    """
+    Helper function to convert XLSX data to a dictionary.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the XLSX resource.
+        sheets (str or list, optional): The name of the sheet, or the names of the sheets, to include.
+            Defaults to every sheet.
+        lazy (bool, optional): Whether to parse each sheet only when it is first accessed (see `LazySheets`).
+
+    Returns:
+        dict: A dictionary from each sheet name to a dictionary represenation of the sheet.
+    """
+    if isinstance(sheets, str):
+        sheets = [sheets]
+
+    if lazy:
+        # The sheets outlive the resource, so they are read from a source of their own rather than the memory map
+        if resource.connectivity is Connectivity.LOCAL and resource.compression is None:
+            source = resource.url
+        else:
+            with resource.open_binary() as data:
+                source = BytesIO(data.read())
+        return LazySheets(source, sheets)
+
+    if sheets is None:
+        df = resource.parse(InputType.XLSX)
+    else:
+        with resource.open_binary() as data:
+            if not data.seekable():
+                data = BytesIO(data.read())  # The directory of a ZIP archive is at its end
+            df = read_excel(data, sheet_name=list(sheets))
+
+    sheets_dict = {}
+    for sheet_name, df in df.items():
+        sheets_dict[sheet_name] = df.to_dict()
+    return sheets_dict
+
+
+def _arrow_source(resource):
+    """
+    Helper function to open the resource data for random access by pyarrow, without copying it where possible.
+
+    Raises:
+        ImportError: pyarrow is not installed.
+    """
+    if ipc is None:
+        raise ImportError("pyarrow is required to read Parquet and Arrow data.")
+    if resource.content is not None:
+        return BufferReader(py_buffer(resource.content))
+    if resource.connectivity == Connectivity.LOCAL and resource.compression is None:
+        return memory_map(resource.url)
+    with resource.open_binary() as data:
+        return BufferReader(data.read())  # The metadata of Parquet and Arrow files is at their end, past any stream
+
+
+def _read_parquet(resource, columns=None, row_groups=None):
+    """
+    Helper function to read Parquet data into a pyarrow Table,
+    decoding only the requested columns of the requested row groups.
+    """
+    parquet_file = ParquetFile(_arrow_source(resource))
+    if row_groups is None:
+        return parquet_file.read(columns=columns)
+    return parquet_file.read_row_groups(row_groups, columns=columns)
+
+
+def _open_arrow(resource):
+    """
+    Helper function to open a reader of the record batches of Arrow IPC data, in the file or the stream format.
+    """
+    source = _arrow_source(resource)
+    if resource.head(len(ARROW_SIGNATURE)) == ARROW_SIGNATURE:
+        return ipc.open_file(source)
+    return ipc.open_stream(source)
+
+
+def _iter_arrow_batches(resource):
+    """
+    Helper function to lazily read the record batches of Arrow IPC data.
+    """
+    reader = _open_arrow(resource)
+    if isinstance(reader, ipc.RecordBatchFileReader):
+        for i in range(reader.num_record_batches):
+            yield reader.get_batch(i)
+    else:
+        yield from reader
+
+
+def _read_arrow(resource, columns=None):
+    """
+    Helper function to read Arrow IPC data into a pyarrow Table, keeping only the requested columns.
+
+    Memory-mapped data is read without copying, so the columns that are not requested are never touched.
+    """
+    table = _open_arrow(resource).read_all()
+    return table if columns is None else table.select(columns)
+
+
+def _table_to_dict(table):
+    """
+    Helper function to convert a pyarrow Table to a dictionary from each column name to a numpy array of the column.
+    """
+    return {name: column.to_numpy() for name, column in zip(table.column_names, table.columns)}
+
+
+def parquet_to_dataframe(resource, columns=None, row_groups=None):
+    """
+    Helper function to convert Parquet data to a pandas DataFrame.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the Parquet resource.
+        columns (list, optional): The names of the columns to read. Defaults to every column.
+        row_groups (list, optional): The indices of the row groups to read. Defaults to every row group.
+
+    Returns:
+        pandas.DataFrame: A pandas DataFrame of the Parquet resource.
+    """
+    return _read_parquet(resource, columns, row_groups).to_pandas()
+
+
+def parquet_to_dict(resource, columns=None, row_groups=None):
+    """
+    Helper function to convert Parquet data to a column-oriented dictionary.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the Parquet resource.
+        columns (list, optional): The names of the columns to read. Defaults to every column.
+        row_groups (list, optional): The indices of the row groups to read. Defaults to every row group.
+
+    Returns:
+        dict: A dictionary from each column name to a numpy array of the column.
+    """
+    return _table_to_dict(_read_parquet(resource, columns, row_groups))
+
+
+def parquet_to_list(resource, columns=None, row_groups=None):
+    """
+    Helper function to convert Parquet data to a list.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the Parquet resource.
+        columns (list, optional): The names of the columns to read. Defaults to every column.
+        row_groups (list, optional): The indices of the row groups to read. Defaults to every row group.
+
+    Returns:
+        list: A list of dictionaries, one per row of the Parquet resource.
+    """
+    return _read_parquet(resource, columns, row_groups).to_pylist()
+
+
+def arrow_to_dataframe(resource, columns=None):
+    """
+    Helper function to convert Arrow IPC data to a pandas DataFrame.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the Arrow resource.
+        columns (list, optional): The names of the columns to read. Defaults to every column.
+
+    Returns:
+        pandas.DataFrame: A pandas DataFrame of the Arrow resource.
+    """
+    return _read_arrow(resource, columns).to_pandas()
+
+
+def arrow_to_dict(resource, columns=None):
+    """
+    Helper function to convert Arrow IPC data to a column-oriented dictionary.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the Arrow resource.
+        columns (list, optional): The names of the columns to read. Defaults to every column.
+
+    Returns:
+        dict: A dictionary from each column name to a numpy array of the column.
+    """
+    return _table_to_dict(_read_arrow(resource, columns))
+
+
+def arrow_to_list(resource, columns=None):
+    """
+    Helper function to convert Arrow IPC data to a list.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the Arrow resource.
+        columns (list, optional): The names of the columns to read. Defaults to every column.
+
+    Returns:
+        list: A list of dictionaries, one per row of the Arrow resource.
+    """
+    return _read_arrow(resource, columns).to_pylist()
+
+
+_JSON_DECODER = JSONDecoder()
+
+
+def _iter_json_values(text, backend=None):
+    """
+    Helper function to incrementally decode a JSON document from a text stream.
+    If the top-level value is an array, its elements are yielded one at a time as they are read;
+    otherwise, the top-level value is yielded as a whole.
+    """
+    buffer = ""
+    while not buffer:
+        chunk = text.read(CHUNK_SIZE)
+        buffer = chunk.lstrip("\ufeff \t\r\n")
+        if not chunk:
+            break
+
+    if buffer[:1] != "[":
+        yield decode_json(buffer + text.read(), backend)
+        return
+
+    pos = 1
+    eof = False
+    expect_value = True  # Whether the next token must be a value (as opposed to "," or "]")
+    first = True
+    read_size = CHUNK_SIZE
+    while True:
+        # Skip whitespace, reading more data as needed
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buffer) or eof:
+                break
+            buffer, pos = text.read(CHUNK_SIZE), 0
+            eof = not buffer
+
+        if pos >= len(buffer):
+            raise ValueError("Unterminated JSON array.")
+
+        char = buffer[pos]
+        if char == "]" and (first or not expect_value):
+            # As for a whole document, only whitespace may follow the top-level array
+            rest = buffer[pos + 1 :]
+            while not rest.strip(" \t\r\n"):
+                rest = text.read(CHUNK_SIZE)
+                if not rest:
+                    return
+            raise ValueError("Extra data after the JSON array.")
+        if not expect_value:
+            if char != ",":
+                raise ValueError(f"Expecting ',' delimiter in JSON array, found {char!r}.")
+            pos += 1
+            expect_value = True
+            continue
+
+        try:
+            value, end = _JSON_DECODER.raw_decode(buffer, pos)
+            # A number may continue past what has been read, so the value must be followed by a delimiter
+            complete = eof or (end < len(buffer) and buffer[end] in " \t\r\n,]")
+        except ValueError:
+            if eof:
+                raise
+            complete = False
+
+        if not complete:
+            # The value straddles the end of the buffer: read more, doubling the read size for large values
+            more = text.read(read_size)
+            eof = not more
+            buffer = buffer[pos:] + more
+            pos = 0
+            read_size *= 2
+            continue
+
+        yield value
+        pos = end
+        expect_value = first = False
+        read_size = CHUNK_SIZE
+        if pos >= CHUNK_SIZE:
+            buffer, pos = buffer[pos:], 0  # Let go of the values that have been yielded
+
+
+def json_to_iter(resource, json_backend=None):
+    """
+    Helper function to lazily read the elements of JSON data.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the JSON resource.
+        json_backend (str, optional): The key of `JSON_BACKENDS` to decode a top-level value that is not an array with.
+            The elements of an array are decoded incrementally by the json module.
+
+    Yields:
+        object: Each element of a top-level JSON array, or the top-level JSON value if it is not an array.
+    """
+    with resource.open_text() as text:
+        yield from _iter_json_values(text, json_backend)
+
+
+def ndjson_to_iter(resource, json_backend=None):
+    """
+    Helper function to lazily read the values of NDJSON data, one line at a time.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the NDJSON resource.
+        json_backend (str, optional): The key of `JSON_BACKENDS` to decode with (see `decode_json`).
+
+    Yields:
+        object: The JSON value on each non-blank line of the NDJSON resource.
+    """
+    with resource.open_text() as text:
+        for line in text:
+            if line.strip():
+                yield decode_json(line, json_backend)
+
+
+def csv_to_iter(resource):
+    """
+    Helper function to lazily read the rows of CSV data.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the CSV resource.
+
+    Yields:
+        dict: Each row of the CSV resource.
+    """
+    with resource.open_text() as text:
+        yield from DictReader(text)
+
+
+def tsv_to_iter(resource):
+    """
+    Helper function to lazily read the rows of TSV data.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the TSV resource.
+
+    Yields:
+        dict: Each row of the TSV resource.
+    """
+    with resource.open_text() as text:
+        yield from DictReader(text, delimiter="\t")
+
+
+def _tag_matches(tag, name):
+    """
+    Helper function to compare a tag to a tag name, ignoring any namespace prefix of the tag.
+    """
+    return tag == name or tag.endswith(":" + name)
+
+
+_XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"  # The namespace of the xml: prefix, bound implicitly
+
+
+def _prefixed(name, namespaces):
+    """
+    Helper function to turn an ElementTree name (`{uri}local`) back into the prefixed name of the document,
+    given a dictionary from each namespace URI in scope to its prefix.
+    """
+    if name[:1] != "{":
+        return name
+    uri, local = name[1:].split("}", 1)
+    prefix = namespaces.get(uri)
+    return f"{prefix}:{local}" if prefix else local
+
+
+def _iter_xml_records(data, record_path=None):
+    """
+    Helper function to incrementally parse the record elements of an XML document from a binary stream.
+    Each record element is discarded once yielded, as are elements at the same depth that are not records,
+    so memory use is bounded by the size of a record rather than by the size of the document.
+
+    Names keep the namespace prefixes of the document, and namespace declarations are kept as `xmlns` attributes
+    of the elements that make them, so that records look exactly like the records of `xml_to_dict`.
+    """
+    names = record_path.strip("/").split("/") if record_path else None
+    depth = len(names) if names else 2  # By default, the records are the children of the root element
+
+    elements = []  # The chain of open elements, from the root element
+    scopes = [{_XML_NAMESPACE: "xml"}]  # The namespaces in scope of each open element, from URI to prefix
+    declared = []  # The namespaces declared by the next element, as (prefix, URI) pairs
+    for event, item in iterparse(data, events=("start-ns", "start", "end")):
+        if event == "start-ns":
+            declared.append(item)
+            continue
+
+        elem = item
+        if event == "start":
+            namespaces = scopes[-1]
+            if declared:
+                namespaces = {**namespaces, **{uri: prefix for prefix, uri in declared}}
+            scopes.append(namespaces)
+            if declared or any(name[:1] == "{" for name in elem.attrib):
+                attrib = {f"xmlns:{prefix}" if prefix else "xmlns": uri for prefix, uri in declared}
+                attrib.update((_prefixed(name, namespaces), value) for name, value in elem.attrib.items())
+                elem.attrib.clear()
+                elem.attrib.update(attrib)
+            elem.tag = _prefixed(elem.tag, namespaces)
+            declared = []
+            elements.append(elem)
+            continue
+
+        scopes.pop()
+        elements.pop()
+        if len(elements) + 1 != depth:
+            continue  # Ancestors are kept open; descendants are discarded along with their record
+
+        ancestors = [element.tag for element in elements] + [elem.tag]
+        if names is None or all(_tag_matches(tag, name) for tag, name in zip(ancestors, names)):
+            elem.tail = None  # Text following the record is not part of it
+            # Round-trip through xmltodict, so that records look exactly like the records of `xml_to_dict`
+            (record,) = parse(tostring(elem, encoding="unicode")).values()
+            yield record
+
+        if elements:
+            elements[-1].remove(elem)
+
+
+def xml_to_iter(resource, record_path=None):
+    """
+    Helper function to lazily read the repeated record elements of XML data.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the XML resource.
+        record_path (str, optional): The slash-separated tag names leading from the root element
+            to the record elements (e.g. `catalog/item`). Defaults to the children of the root element.
+
+    Yields:
+        dict: Each record element, in the same representation as `xml_to_dict`.
+            Tag names in the record path match regardless of namespace prefix.
+    """
+    with resource.open_binary() as data:
+        yield from _iter_xml_records(data, record_path)
+
+
+def xlsx_to_iter(resource, sheet=None):
+    """
+    Helper function to lazily read the rows of a sheet of XLSX data, using openpyxl's read-only mode.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the XLSX resource.
+        sheet (str, optional): The name of the sheet. Defaults to the first sheet.
+
+    Yields:
+        dict: Each row of the sheet, keyed by the values of the first row. Empty rows are skipped.
+    """
+    with resource.open_binary() as data:
+        if not data.seekable():
+            data = BytesIO(data.read())  # The directory of a ZIP archive is at its end
+        workbook = load_workbook(data, read_only=True, data_only=True)
+        try:
+            worksheet = workbook.worksheets[0] if sheet is None else workbook[sheet]
+            rows = (values for values in worksheet.iter_rows(values_only=True) if any(v is not None for v in values))
+            header = next(rows, ())
+            for values in rows:
+                yield dict(zip(header, values))
+        finally:
+            workbook.close()
+
+
+def parquet_to_iter(resource):
+    """
+    Helper function to lazily read the rows of Parquet data, one batch of rows at a time.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the Parquet resource.
+
+    Yields:
+        dict: Each row of the Parquet resource.
+    """
+    for batch in ParquetFile(_arrow_source(resource)).iter_batches():
+        yield from batch.to_pylist()
+
+
+def arrow_to_iter(resource):
+    """
+    Helper function to lazily read the rows of Arrow IPC data, one record batch at a time.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the Arrow resource.
+
+    Yields:
+        dict: Each row of the Arrow resource.
+    """
+    for batch in _iter_arrow_batches(resource):
+        yield from batch.to_pylist()
+
+
+STREAMERS = {
+    InputType.JSON: json_to_iter,
+    InputType.CSV: csv_to_iter,
+    InputType.TSV: tsv_to_iter,
+    InputType.XML: xml_to_iter,
+    InputType.XLSX: xlsx_to_iter,
+    InputType.NDJSON: ndjson_to_iter,
+    InputType.PARQUET: parquet_to_iter,
+    InputType.ARROW: arrow_to_iter,
+}
+"""
+A dictionary of streaming conversions,
+where the key is an input type that can be read lazily,
+and the value is a generator function yielding the records of the resource one at a time.
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+
+def _batched(records, size):
+    """
+    Helper function to group an iterable into lists of at most `size` items.
+    """
+    records = iter(records)
+    while True:
+        batch = list(islice(records, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _normalize_batches(records, chunksize):
+    """
+    Helper function to build a pandas DataFrame from each batch of `chunksize` JSON records,
+    with the index continuing from one DataFrame to the next (as for `read_csv` chunks).
+    """
+    offset = 0
+    for batch in _batched(records, chunksize):
+        df = json_normalize(batch)
+        df.index += offset
+        offset += len(batch)
+        yield df
+
+
+def json_to_chunks(resource, chunksize, json_backend=None):
+    """
+    Helper function to lazily convert the elements of JSON data to pandas DataFrames, `chunksize` elements at a time.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the JSON resource.
+        chunksize (int): The number of elements per DataFrame.
+        json_backend (str, optional): The key of `JSON_BACKENDS` to decode with (see `json_to_iter`).
+
+    Yields:
+        pandas.DataFrame: A pandas DataFrame of each batch of elements of a top-level JSON array.
+    """
+    yield from _normalize_batches(json_to_iter(resource, json_backend), chunksize)
+
+
+def ndjson_to_chunks(resource, chunksize, json_backend=None):
+    """
+    Helper function to lazily convert the lines of NDJSON data to pandas DataFrames, `chunksize` lines at a time.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the NDJSON resource.
+        chunksize (int): The number of lines per DataFrame.
+        json_backend (str, optional): The key of `JSON_BACKENDS` to decode with (see `decode_json`).
+
+    Yields:
+        pandas.DataFrame: A pandas DataFrame of each batch of lines of the NDJSON resource.
+    """
+    yield from _normalize_batches(ndjson_to_iter(resource, json_backend), chunksize)
+
+
+def _delimited_to_chunks(resource, chunksize, delimiter):
+    """
+    Helper function to lazily read delimited data into pandas DataFrames with the vectorized C parser.
+    """
+    with resource.open_binary() as data:
+        with read_csv(data, sep=delimiter, engine="c", encoding=resource.encoding, chunksize=chunksize) as chunks:
+            yield from chunks
+
+
+def csv_to_chunks(resource, chunksize):
+    """
+    Helper function to lazily convert CSV data to pandas DataFrames, `chunksize` rows at a time.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the CSV resource.
+        chunksize (int): The number of rows per DataFrame.
+
+    Yields:
+        pandas.DataFrame: A pandas DataFrame of each batch of rows of the CSV resource.
+    """
+    yield from _delimited_to_chunks(resource, chunksize, ",")
+
+
+def tsv_to_chunks(resource, chunksize):
+    """
+    Helper function to lazily convert TSV data to pandas DataFrames, `chunksize` rows at a time.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the TSV resource.
+        chunksize (int): The number of rows per DataFrame.
+
+    Yields:
+        pandas.DataFrame: A pandas DataFrame of each batch of rows of the TSV resource.
+    """
+    yield from _delimited_to_chunks(resource, chunksize, "\t")
+
+
+def _batches_to_chunks(batches, chunksize):
+    """
+    Helper function to regroup pyarrow record batches into pandas DataFrames of `chunksize` rows,
+    with the index continuing from one DataFrame to the next (as for `read_csv` chunks).
+    """
+    offset = 0
+    pending = None
+    for batch in batches:
+        table = Table.from_batches([batch])
+        pending = table if pending is None else concat_tables([pending, table])
+        while pending.num_rows >= chunksize:
+            df = pending.slice(0, chunksize).to_pandas()
+            df.index += offset
+            offset += chunksize
+            pending = pending.slice(chunksize)
+            yield df
+    if pending is not None and pending.num_rows > 0:
+        df = pending.to_pandas()
+        df.index += offset
+        yield df
+
+
+def parquet_to_chunks(resource, chunksize, columns=None, row_groups=None):
+    """
+    Helper function to lazily convert Parquet data to pandas DataFrames, `chunksize` rows at a time.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the Parquet resource.
+        chunksize (int): The number of rows per DataFrame.
+        columns (list, optional): The names of the columns to read. Defaults to every column.
+        row_groups (list, optional): The indices of the row groups to read. Defaults to every row group.
+
+    Yields:
+        pandas.DataFrame: A pandas DataFrame of each batch of rows of the Parquet resource.
+    """
+    batches = ParquetFile(_arrow_source(resource)).iter_batches(
+        batch_size=chunksize, row_groups=row_groups, columns=columns
+    )
+    yield from _batches_to_chunks(batches, chunksize)
+
+
+def arrow_to_chunks(resource, chunksize, columns=None):
+    """
+    Helper function to lazily convert Arrow IPC data to pandas DataFrames, `chunksize` rows at a time.
+
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        resource (:obj:`Resource`): The Resource object for the Arrow resource.
+        chunksize (int): The number of rows per DataFrame.
+        columns (list, optional): The names of the columns to keep. Defaults to every column.
+
+    Yields:
+        pandas.DataFrame: A pandas DataFrame of each batch of rows of the Arrow resource.
+    """
+    batches = _iter_arrow_batches(resource)
+    if columns is not None:
+        batches = (batch.select(columns) for batch in batches)
+    yield from _batches_to_chunks(batches, chunksize)
+
+
+CHUNKERS = {
+    InputType.JSON: json_to_chunks,
+    InputType.CSV: csv_to_chunks,
+    InputType.TSV: tsv_to_chunks,
+    InputType.NDJSON: ndjson_to_chunks,
+    InputType.PARQUET: parquet_to_chunks,
+    InputType.ARROW: arrow_to_chunks,
+}
+"""
+A dictionary of chunked DataFrame conversions,
+where the key is an input type that can be read lazily,
+and the value is a generator function yielding pandas DataFrames of a given number of records at a time,
+which accepts the keyword options of its input type (see `CONVERSION_OPTIONS`).
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+CONVERTERS = {
+    (InputType.JSON, dict): json_to_dict,
+    (InputType.JSON, list): json_to_list,
+    (InputType.JSON, DataFrame): json_to_dataframe,
+    (InputType.CSV, list): csv_to_list,
+    (InputType.CSV, DataFrame): csv_to_dataframe,
+    (InputType.CSV, dict): csv_to_dict,
+    (InputType.CSV, Rows): csv_to_rows,
+    (InputType.TSV, list): tsv_to_list,
+    (InputType.TSV, DataFrame): tsv_to_dataframe,
+    (InputType.TSV, dict): tsv_to_dict,
+    (InputType.TSV, Rows): tsv_to_rows,
+    (InputType.XML, dict): xml_to_dict,
+    (InputType.XLSX, dict): xlsx_to_dict,
+    (InputType.NDJSON, list): ndjson_to_list,
+    (InputType.NDJSON, DataFrame): ndjson_to_dataframe,
+    (InputType.PARQUET, DataFrame): parquet_to_dataframe,
+    (InputType.PARQUET, dict): parquet_to_dict,
+    (InputType.PARQUET, list): parquet_to_list,
+    (InputType.ARROW, DataFrame): arrow_to_dataframe,
+    (InputType.ARROW, dict): arrow_to_dict,
+    (InputType.ARROW, list): arrow_to_list,
+}
+"""
+A dictionary of conversions,
+where the key is an (input type, output type) pair listed in `CONVERSIONS`,
+and the value is a function converting a Resource object of the input type into the output type,
+given the options of the input type (see `CONVERSION_OPTIONS`) as keyword arguments.
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
+ENTRY_POINT_GROUP = "pyobjectify.formats"
+"""
+The entry point group through which installed packages provide format plugins (see `load_plugins`).
+
+The end-user does not have to interface with this, but it is provided for more granular operations.
+"""
+
 
-    The end-user does not have to interface with this, but it is provided for more granular operations.
+class Format:
     """
+    A format plugin, bundling everything pyobjectify needs to detect and convert an input type.
 
-    ONLINE_STATIC = auto()
-    LOCAL = auto()
+    Register it with `register_format`, or provide it through the `ENTRY_POINT_GROUP` entry point group.
 
+    Args:
+        in_type (:obj:`Hashable`): The input type. Third-party formats may use any hashable value, such as a string.
+        sniffer (function): A cheap probe `sniffer(prefix, text, truncated)` scoring a resource prefix
+            from 0 (impossible) to 1 (certain) (see `SNIFFERS`).
+        converters (dict): A dictionary from each supported output type, in order of preference,
+            to a function converting a Resource object into that output type (see `CONVERTERS`).
+        cost (int, optional): The relative cost of the probe (see `SNIFF_COSTS`). Defaults to 1.
+        priority (int, optional): The tie-breaking priority of the probe (see `SNIFF_PRIORITIES`). Defaults to 0.
+        parsers (dict, optional): Parsers of the input type to share across conversions (see `PARSERS`).
+        streamer (function, optional): A streaming conversion of the input type (see `STREAMERS`).
+        chunker (function, optional): A chunked DataFrame conversion of the input type (see `CHUNKERS`).
+        options (tuple, optional): The names of the keyword options of the converters (see `CONVERSION_OPTIONS`).
+        extensions (tuple, optional): The file extensions of the input type, such as `".kv"` (see `EXTENSIONS`).
+        content_types (tuple, optional): The media types of the input type, such as `"text/x-kv"`
+            (see `CONTENT_TYPES`).
+    """
 
-class Resource:
+    def __init__(
+        self,
+        in_type,
+        sniffer,
+        converters,
+        cost=1,
+        priority=0,
+        parsers=None,
+        streamer=None,
+        chunker=None,
+        options=(),
+        extensions=(),
+        content_types=(),
+    ):
+        self.in_type = in_type
+        self.sniffer = sniffer
+        self.converters = dict(converters)
+        self.cost = cost
+        self.priority = priority
+        self.parsers = dict(parsers or {})
+        self.streamer = streamer
+        self.chunker = chunker
+        self.options = tuple(options)
+        self.extensions = tuple("." + extension.lstrip(".").lower() for extension in extensions)
+        self.content_types = tuple(content_type.lower() for content_type in content_types)
+
+    def __repr__(self):
+        return f"Format({self.in_type!r})"
+
+
+def register_format(fmt):
     """
-    The Resource class stores some metadata about the resource to simplify the code.
+    Register a format plugin, adding its input type to detection and conversion.
 
     The end-user does not have to interface with this, but it is provided for more granular operations.
+
+    Args:
+        fmt (:obj:`Format`): The format plugin.
+
+    Raises:
+        TypeError: The format converts into an output type that is not supported,
+            or its input type, one of its file extensions or one of its media types is taken.
     """
+    unsupported = [out_type for out_type in fmt.converters if out_type not in OUTPUT_TYPES]
+    if unsupported:
+        raise TypeError(f"The output types {unsupported} are not supported.")
+    if fmt.in_type in SNIFFERS:
+        raise TypeError(f"The input type {fmt.in_type} is already registered.")
+    taken = [name for name in fmt.extensions if name in EXTENSIONS]
+    taken += [name for name in fmt.content_types if name in CONTENT_TYPES]
+    if taken:
+        raise TypeError(f"The file extensions or media types {taken} are already registered.")
+
+    SNIFFERS[fmt.in_type] = fmt.sniffer
+    SNIFF_COSTS[fmt.in_type] = fmt.cost
+    SNIFF_PRIORITIES[fmt.in_type] = fmt.priority
+    CONVERSIONS[fmt.in_type] = list(fmt.converters)
+    for out_type, converter in fmt.converters.items():
+        CONVERTERS[(fmt.in_type, out_type)] = converter
+    PARSERS.update(fmt.parsers)
+    if fmt.streamer is not None:
+        STREAMERS[fmt.in_type] = fmt.streamer
+    if fmt.chunker is not None:
+        CHUNKERS[fmt.in_type] = fmt.chunker
+    if fmt.options:
+        CONVERSION_OPTIONS[fmt.in_type] = fmt.options
+    for extension in fmt.extensions:
+        EXTENSIONS[extension] = fmt.in_type
+    for content_type in fmt.content_types:
+        CONTENT_TYPES[content_type] = fmt.in_type
+
+
+_plugins_lock = Lock()
+_plugins_loaded = False
+
+
+def load_plugins():
+    """
+    Register the format plugins provided by installed packages through the `ENTRY_POINT_GROUP` entry point group.
 
-    def __init__(self, url, connectivity):
-        url = url.replace("file://", "")
-        self.url = url
-        self.connectivity = connectivity
+    Each entry point names either a Format object, or a function taking no arguments that returns one
+    (or a list of them). Plugins are only loaded once; a plugin that fails to load is skipped with a warning.
 
-        if connectivity == Connectivity.ONLINE_STATIC:
-            response = get(url)
-            self.response = response
-            self.plaintext = response.text
+    The end-user does not have to interface with this, but it is provided for more granular operations.
+    """
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
 
-        elif connectivity == Connectivity.LOCAL:
-            url = url.replace("file://", "")
+    with _plugins_lock:
+        if _plugins_loaded:
+            return
+        try:
+            discovered = entry_points(group=ENTRY_POINT_GROUP)
+        except TypeError:  # Python < 3.10 groups every entry point by name
+            discovered = entry_points().get(ENTRY_POINT_GROUP, ())
 
-            file_obj = open(url, "r")
-            self.response = file_obj
+        for entry_point in discovered:
             try:
-                self.plaintext = file_obj.read()
-                self.response.seek(0, 0)
-            except Exception:  # XLSX data does not like to be read
-                self.plaintext = None
-
-    def __eq__(self, other):
-        # For Internet resources,
-        # Resource.response may have stochastic attributes like time elapsed.
-        # URL, connectivity type, plaintext should be enough to determine different Resources.
-        return self.url == other.url and self.connectivity == other.connectivity and self.plaintext == other.plaintext
+                plugin = entry_point.load()
+                formats = plugin if isinstance(plugin, Format) else plugin()
+                for fmt in [formats] if isinstance(formats, Format) else formats:
+                    register_format(fmt)
+            except Exception as exc:
+                warn(f"The format plugin {entry_point.name} could not be loaded: {exc}")
+        _plugins_loaded = True
 
 
-def url_to_connectivity(url):
+class Stats:
     """
-    Get the connectivity type of the resource.
+    An optional record of a call to `from_url`, for finding out where the time of a call went.
 
-    The end-user does not have to interface with this, but it is provided for more granular operations.
+    Each stage of the call is timed with a monotonic clock under its name in `stages`:
+    `connectivity`, `cache` (the result cache lookups), `retrieve`, `detect`, `conversions`,
+    `load` (the download of an Internet resource once it is known to be convertible), `convert` and `close`.
+    Stages that did not run (e.g. after a result cache hit) are absent.
 
-    Args:
-        url (str): The URL to a resource.
+    When no Stats object is given to `from_url`, nothing is timed or recorded.
 
-    Returns:
-        Connectivity: An attribute in the enumeration `Connectivity`. The calculated connectivity of the resource type.
+    Args:
+        hooks (:obj:`Iterable`, optional): Functions called as `hook(stage, seconds, stats)` as each stage ends,
+            with the seconds of that run of the stage.
+        tracer (:obj:`opentelemetry.trace.Tracer`, optional): A tracer to open a span for each stage with,
+            named `pyobjectify.<stage>`. Any object with an OpenTelemetry-style `start_as_current_span` will do.
+
+    Attributes:
+        url (str): The URL to the resource.
+        stages (dict): The seconds spent in each stage, in the order the stages ran.
+        bytes_read (int): The number of bytes of resource data read, or None if the data was streamed.
+        candidates (list): The possible input types of the resource, with the most likely input type first.
+        rejected (list): The (input type, output type) conversions that were tried and failed,
+            each paired with the exception raised.
+        conversion (tuple): The (input type, output type) conversion that succeeded, or None.
+        cache_hit (bool): Whether the result was reused from the result cache.
     """
-    local_conditions = [url.startswith("file:///"), url.startswith("/"), url.startswith(".")]
-    if any(local_conditions):
-        return Connectivity.LOCAL
-    else:
-        return Connectivity.ONLINE_STATIC
 
+    def __init__(self, hooks=(), tracer=None):
+        self.hooks = list(hooks)
+        self.tracer = tracer
+        self.url = None
+        self.stages = {}
+        self.bytes_read = None
+        self.candidates = []
+        self.rejected = []
+        self.conversion = None
+        self.cache_hit = False
+
+    @property
+    def total(self):
+        """
+        float: The seconds spent in all stages.
+        """
+        return sum(self.stages.values())
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time a stage of the call, within a span of the tracer if there is one.
+
+        Args:
+            name (str): The name of the stage.
+        """
+        span = nullcontext() if self.tracer is None else self.tracer.start_as_current_span(f"pyobjectify.{name}")
+        with span:
+            start = perf_counter()
+            try:
+                yield
+            finally:
+                seconds = perf_counter() - start
+                self.stages[name] = self.stages.get(name, 0.0) + seconds  # A stage may run more than once
+                for hook in self.hooks:
+                    hook(name, seconds, self)
 
-def retrieve_resource(url, connectivity):
-    """
-    Retrieves the resource at the URL using the connectivity type and stores it in a Resource object.
+    def __repr__(self):
+        stages = ", ".join(f"{name}={seconds:.6f}s" for name, seconds in self.stages.items())
+        return f"Stats({self.url!r}, {stages})"
 
-    The end-user does not have to interface with this, but it is provided for more granular operations.
 
-    Args:
-        url (str): The URL to a resource.
-        connectivity (:obj:`Connectivity`): An attribute in the enumeration Connectivity.
-            The calculated connectivity type of the resource.
+_NO_STAGE = nullcontext()
 
-    Returns:
-        Resource: The Resource object for the resource at the URL specified.
 
-    Raises:
-        TypeError: The connectivity type is not supported.
+def _stage(stats, name):
     """
-    if not isinstance(connectivity, Connectivity):
-        raise TypeError(f"The connectivity type {connectivity} is not supported.")
-
-    return Resource(url, connectivity)
+    Helper function to time a stage of a call if it is being recorded, and to do nothing otherwise.
+    """
+    return _NO_STAGE if stats is None else stats.stage(name)
 
 
-def get_resource_types(resource):
+def convert(resource, conversions, stats=None, **options):
     """
-    Get possible resource types of the resource.
+    Attempts to convert the resource data through possible conversions (see `CONVERTERS`).
 
     The end-user does not have to interface with this, but it is provided for more granular operations.
 
     Args:
-        resource (:obj:`Resource`): The Resource object for the resource.
+        resource (:obj:`Resource`): he Resource object for the resource.
+        conversions (list): The list of all possible conversions, filtered if user specified output data type.
+        stats (:obj:`Stats`, optional): A record to note the conversions that failed and the one that succeeded in.
+        **options: Keyword options of the conversions (see `CONVERSION_OPTIONS`).
+            Each conversion is only given the options of its input type.
 
     Returns:
-        list: A list of possible resource types of the resource.
+        object: The first successful conversion from the probable resource type to an output data type.
 
     Raises:
-        TypeError: The resource is of a type that is not supported.
+        TypeError: None of the possible conversions were successful.
     """
-    possible = list(InputType)
+    for conversion in conversions:
+        try:
+            i_type, o_type = conversion
+            i_options = {name: value for name, value in options.items() if name in CONVERSION_OPTIONS.get(i_type, ())}
+            # Return the first conversion that works.
+            output = CONVERTERS[conversion](resource, **i_options)
+        except Exception as e:
+            if stats is not None:
+                stats.rejected.append((conversion, e))
+            continue  # Try the next conversion
+        if stats is not None:
+            stats.conversion = conversion
+        return output
 
-    try:
-        _ = loads(resource.plaintext)
-    except Exception:
-        possible.remove(InputType.JSON)
-        pass
+    # Reach here means none of the conversions worked!
+    raise TypeError("The type of the resource is not supported.")
 
-    try:
-        dicts = DictReader(resource.response)
-        if resource.connectivity is Connectivity.LOCAL:
-            resource.response.seek(0, 0)
-
-        # Ensure that each row has the same number of fields
-        nums_fields = set([len(d.items()) for d in list(dicts)])
-        if resource.connectivity is Connectivity.LOCAL:
-            resource.response.seek(0, 0)
-        assert len(nums_fields) == 1
-        # Ensure that the number of fields is greater than 1
-        (num_fields,) = nums_fields
-
-        assert num_fields > 1  # Data that have only one column will not be interpreted as CSVs
-    except Exception:
-        possible.remove(InputType.CSV)
 
-    try:
-        dicts = DictReader(resource.response, delimiter="\t")
-        if resource.connectivity is Connectivity.LOCAL:
-            resource.response.seek(0, 0)
-
-        # Ensure that each row has the same number of fields
-        nums_fields = set([len(d.items()) for d in list(dicts)])
-        if resource.connectivity is Connectivity.LOCAL:
-            resource.response.seek(0, 0)
-        assert len(nums_fields) == 1
-
-        # Ensure that the number of fields is greater than 1
-        (num_fields,) = nums_fields
-        assert num_fields > 1  # Data that have only one column will not be interpreted as TSVs
-    except Exception:
-        possible.remove(InputType.TSV)
+def _freeze(obj):
+    """
+    Helper function to make a read-only view of nested dictionaries, lists and numpy arrays.
+    Rows are kept as they are, as each Row is read-only already (see `ResultCache._export`).
+    """
+    if isinstance(obj, Rows):
+        return obj
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    if isinstance(obj, ndarray):
+        view = obj.view()
+        view.setflags(write=False)
+        return view
+    return obj
+
+
+class ResultCache:
+    """
+    An in-process store of `from_url` results, so that repeated calls for an unchanged resource
+    skip retrieval (for local files), detection and conversion.
 
-    try:
-        _ = parse(resource.plaintext)
-        assert resource.plaintext[0] == "<"
-    except Exception:
-        possible.remove(InputType.XML)
+    Local files are keyed on their path, modification time, size and the output type,
+    so they are not even opened on a hit.
+    Internet resources are keyed on a hash of their content and the output type, so they are still fetched
+    (pair with an `HTTPCache` to make that a header round-trip), but not parsed again.
+    The least recently used results are evicted to stay within `max_entries` and `max_bytes`,
+    where the size of a result is taken to be the size of its resource data.
 
-    try:
-        df = read_excel(resource.url, sheet_name=None)
-        sheets_dict = {}
-        for sheet_name, df in df.items():
-            sheets_dict[sheet_name] = df.to_dict()
-    except Exception:
-        possible.remove(InputType.XLSX)
+    So that callers cannot corrupt cached results, each hit returns a deep copy (`mode="copy"`)
+    or a shared read-only view (`mode="readonly"`), where dictionaries are returned as `MappingProxyType`,
+    lists as tuples and numpy arrays as read-only views. DataFrames cannot be made read-only, so they are copied
+    in either mode. `Rows` keep their type: their read-only rows are shared, in a new list under a new header.
 
-    if len(possible) == 0:
-        raise TypeError("The type of the resource is not supported.")
+    The end-user does not have to interface with this, but it is provided for more granular operations.
 
-    return possible
+    Args:
+        max_entries (int, optional): The maximum number of results to keep.
+        max_bytes (int, optional): The maximum total size of the resources of the results to keep, in bytes.
+        mode (str, optional): Either `"copy"` or `"readonly"`, as described above.
 
+    Raises:
+        ValueError: The mode is not supported.
+    """
 
-def get_conversions(in_types, out_type=None):
+    MODES = ("copy", "readonly")
+
+    def __init__(self, max_entries=128, max_bytes=64 * 1024 * 1024, mode="copy"):
+        if mode not in self.MODES:
+            raise ValueError(f"The result cache mode {mode} is not supported.")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()  # key -> (result, nbytes), least recently used first
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, url, connectivity, out_type, resource=None, options=None, in_type=None):
+        """
+        Get the cache key for a resource.
+
+        Args:
+            url (str): The URL to a resource.
+            connectivity (:obj:`Connectivity`): The connectivity type of the resource.
+            out_type (:obj:`class`): The user-specified data type of the output, or None.
+            resource (:obj:`Resource`, optional): The retrieved Resource object, required for Internet resources.
+            options (dict, optional): The keyword options of the conversion.
+            in_type (:obj:`InputType`, optional): The user-specified input type of the resource, or None.
+
+        Returns:
+            tuple: The cache key, and the size of the resource data in bytes.
+        """
+        options = repr(sorted((options or {}).items()))  # Option values such as lists are not hashable
+        if connectivity is Connectivity.LOCAL:
+            path = os_path.abspath(url.replace("file://", ""))
+            info = stat(path)
+            return (path, info.st_mtime_ns, info.st_size, out_type, in_type, options), info.st_size
+
+        raw = resource.raw
+        return (sha256(raw).hexdigest(), out_type, in_type, options), len(raw)
+
+    def _export(self, result):
+        if self.mode == "copy":
+            return deepcopy(result)
+        if isinstance(result, DataFrame):
+            return result.copy()
+        if isinstance(result, Rows):
+            rows = copy(result)  # A new list of the same read-only rows
+            rows.header = list(result.header)
+            return rows
+        return result  # Already frozen when stored
+
+    def get(self, key):
+        """
+        Get a cached result, counting a hit or a miss.
+
+        Args:
+            key (tuple): A cache key (see `ResultCache.key`).
+
+        Returns:
+            object: A copy or read-only view of the cached result.
+
+        Raises:
+            KeyError: There is no cached result for the key.
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                raise KeyError(key)
+            self.hits += 1
+            self._entries.move_to_end(key)
+            result, _ = self._entries[key]
+        return self._export(result)
+
+    def put(self, key, result, nbytes):
+        """
+        Cache a result, evicting the least recently used results as necessary.
+
+        Args:
+            key (tuple): A cache key (see `ResultCache.key`).
+            result (object): The result of `from_url`.
+            nbytes (int): The size of the resource data, in bytes.
+
+        Returns:
+            object: A copy or read-only view of the result, to be handed to the caller in place of the result.
+        """
+        if self.mode == "readonly":
+            result = _freeze(result)
+
+        if nbytes <= self.max_bytes:
+            with self._lock:
+                if key in self._entries:
+                    self.nbytes -= self._entries.pop(key)[1]
+                self._entries[key] = (result, nbytes)
+                self.nbytes += nbytes
+                while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+                    _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+                    self.nbytes -= evicted_nbytes
+
+        return self._export(result)
+
+    def clear(self):
+        """
+        Remove every cached result and reset the hit and miss counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = self.hits = self.misses = 0
+
+
+def from_url(url, out_type=None, session=None, result_cache=None, chunksize=None, stats=None, in_type=None, **options):
     """
-    Get possible conversions for the probable resource types.
-    If the user specified a preferred output type, filter out any undesirable conversions to consider.
+    This is the main interface that the end-user interacts with.
+        Given a URL, converts the resource data to a parsable Python object.
 
-    The end-user does not have to interface with this, but it is provided for more granular operations.
+    Internet resources are streamed: the input type is determined from a prefix of the response (see `SNIFF_SIZE`),
+    and the rest is only downloaded once a conversion is known to exist, so unsupported resources fail fast.
 
     Args:
-        in_types (:obj:`list`): A list of calculated possible resource types.
+        url (str): A URL to a resource.
         out_type (:obj:`class`, optional): The user-specified data type of the output.
+        session (:obj:`requests.Session`, optional): The session to fetch Internet resources through.
+            Defaults to the shared PooledSession (see `get_session`).
+        result_cache (:obj:`ResultCache`, optional): The cache to reuse results of earlier calls from.
+        chunksize (int, optional): If given, the resource is streamed and an iterator of pandas DataFrames
+            of `chunksize` records each is returned instead, so that memory use is bounded by the chunk size.
+            Supported for JSON arrays, NDJSON, CSV, TSV, Parquet and Arrow resources. The result cache is not used.
+        stats (:obj:`Stats`, optional): A record to time each stage of the call in,
+            and to note the input types and conversions that were tried in (see `Stats`).
+        in_type (:obj:`InputType`, optional): The user-specified input type of the resource, which skips detection.
+            Without it, a file extension (see `EXTENSIONS`) is trusted if the format probe of its input type agrees,
+            unless that input type cannot be converted into `out_type` or does not support the options.
+            If every conversion of the hinted input type fails, the input type is determined from the data instead.
+        **options: Keyword options of the conversion, which depend on the type of the resource
+            (see `CONVERSION_OPTIONS`), e.g. `sheets=["Sheet1"]` or `lazy=True` for XLSX resources,
+            or `json_backend="json"` for JSON and NDJSON resources (see `JSON_BACKENDS`).
+            The result cache is not used for lazy results.
 
     Returns:
-        list: A list of (in, out) conversion tuples as described above.
+        object: A parsable Python object representation of the resource.
+
     Raises:
-        TypeError: There are no possible conversions.
+        TypeError: The user-specified data type of the output or input, or an option, is not supported.
+        ValueError: The chunk size is not positive, or the JSON backend is not installed.
+        EOFError: The resource is compressed, and its compressed data is truncated.
     """
 
-    # There is guaranteed at least one probable in_type
-    # Go through each probable resource data type.
-    # Use lists to preserve order.
-    conversions = []  # To make a list of possible conversions.
-    poss_out_types = []  # To make list of all output types based on probable input types.
-    for in_type in in_types:
-        for poss_out_type in CONVERSIONS[in_type]:
-            if out_type is None:
-                if (in_type, poss_out_type) not in conversions:
-                    conversions.append((in_type, poss_out_type))
-                if poss_out_type not in poss_out_types:
-                    poss_out_types.append(poss_out_type)
-            elif poss_out_type is out_type:  # (and user specified a preferred output type)
-                if (in_type, poss_out_type) not in conversions:
-                    conversions.append((in_type, poss_out_type))
-                if poss_out_type not in poss_out_types:
-                    poss_out_types.append(poss_out_type)
-    if out_type is not None and out_type not in poss_out_types:
-        raise TypeError(f"The resource cannot be converted into the requested data type {out_type}.")
+    if out_type is not None and out_type not in OUTPUT_TYPES:
+        raise TypeError(f"The specified output type {out_type} is not supported.")
 
-    return conversions
+    _check_in_type(in_type)
+    _check_json_backend(options.get("json_backend"))
 
+    if stats is not None:
+        stats.url = url
 
-def json_to_list(resource):
-    """
-    Helper function to convert JSON data to a list.
+    if chunksize is not None:
+        if out_type not in (None, DataFrame):
+            raise TypeError(f"The specified output type {out_type} cannot be read in chunks.")
+        if chunksize < 1:
+            raise ValueError(f"The chunk size {chunksize} is not positive.")
+        resource, in_type = _retrieve_stream(url, session, CHUNKERS, stats, in_type)
+        unsupported = set(options) - set(CONVERSION_OPTIONS.get(in_type, ()))
+        if unsupported:
+            resource.close()
+            raise TypeError(f"The options {sorted(unsupported)} are not supported for the resource.")
+        return _iter_and_close(resource, CHUNKERS[in_type](resource, chunksize, **options))
 
-    The end-user does not have to interface with this, but it is provided for more granular operations.
+    if options.get("lazy"):
+        result_cache = None  # Lazy results hold the workbook open, so they cannot be shared or copied
 
-    Args:
-        resource (:obj:`Resource`): The Resource object for the JSON resource.
+    # (1) Get resource connectivity type
+    with _stage(stats, "connectivity"):
+        connectivity = url_to_connectivity(url)
 
-    Returns:
-        list: A list represenation of the JSON resource.
-    """
-    json = loads(resource.plaintext)
-    if type(json) is dict:
-        return [json]
-    return json
+    # Local files can be looked up in the result cache without being opened
+    if result_cache is not None and connectivity is Connectivity.LOCAL:
+        with _stage(stats, "cache"):
+            key, nbytes = result_cache.key(url, connectivity, out_type, options=options, in_type=in_type)
+            try:
+                output = result_cache.get(key)
+            except KeyError:
+                pass
+            else:
+                if stats is not None:
+                    stats.cache_hit = True
+                return output
+
+    # (2) Retrieve resource. Internet resources are streamed, so that only a prefix is read until (3) and (4) pass
+    online = connectivity is Connectivity.ONLINE_STATIC
+    with _stage(stats, "retrieve"):
+        resource = retrieve_resource(url, connectivity, stream=online, session=session)
+
+    # (3) Determine input type and (4) possible conversions
+    in_types, conversions, hinted = _plan_resource(resource, out_type, in_type, options, stats)
+
+    # Read the rest of an Internet resource, now that it is known to be convertible
+    if online:
+        with _stage(stats, "load"):
+            resource.load()
+    if stats is not None:
+        stats.bytes_read = len(resource.raw)
+
+    if result_cache is not None and online:
+        with _stage(stats, "cache"):
+            key, nbytes = result_cache.key(url, connectivity, out_type, resource, options, in_type)
+            try:
+                output = result_cache.get(key)
+            except KeyError:
+                pass
+            else:
+                resource.close()
+                if stats is not None:
+                    stats.cache_hit = True
+                return output
+
+    try:
+        # (5) Convert to output type
+        output = _convert_resource(resource, in_types, conversions, hinted, out_type, options, stats)
+    finally:
+        # (6) Release the memory map or connection, even if every conversion failed
+        with _stage(stats, "close"):
+            resource.close()
+
+    if result_cache is not None:
+        output = result_cache.put(key, output, nbytes)
+
+    return output
 
 
-def json_to_dict(resource):
+async def async_from_url(url, out_type=None, executor=None, **kwargs):
     """
-    Helper function to convert JSON data to a dictionary.
+    The asyncio counterpart of `from_url`.
+        Given a URL, converts the resource data to a parsable Python object without blocking the event loop.
 
-    The end-user does not have to interface with this, but it is provided for more granular operations.
+    Retrieval and conversion both run in an executor, so neither blocking I/O nor parsing holds up the event loop.
 
     Args:
-        resource (:obj:`Resource`): The Resource object for the JSON resource.
+        url (str): A URL to a resource.
+        out_type (:obj:`class`, optional): The user-specified data type of the output.
+        executor (:obj:`concurrent.futures.Executor`, optional): The executor to run in.
+            Defaults to the event loop's default executor.
+        **kwargs: Any other keyword arguments of `from_url`.
 
     Returns:
-        dict: A dictionary represenation of the JSON resource.
+        object: A parsable Python object representation of the resource.
+
+    Raises:
+        TypeError: The user-specified data type of the output is not supported.
     """
-    json = loads(resource.plaintext)
-    if type(json) is list:
-        return {"data": json}
-    return json
+    loop = get_running_loop()
+    return await loop.run_in_executor(executor, partial(from_url, url, out_type, **kwargs))
 
 
-def json_to_dataframe(resource):
+async def gather_urls(urls, concurrency=10, out_type=None, session=None, **kwargs):
     """
-    Helper function to convert JSON data to a pandas DataFrame.
+    Converts the resource data at many URLs concurrently, with at most `concurrency` resources in flight at a time.
 
-    The end-user does not have to interface with this, but it is provided for more granular operations.
+    A failure does not abort the batch: the exception is returned in place of the result for that URL.
 
     Args:
-        resource (:obj:`Resource`): The Resource object for the JSON resource.
+        urls (:obj:`Iterable`): The URLs to resources.
+        concurrency (int, optional): The maximum number of resources retrieved and converted at a time.
+        out_type (:obj:`class`, optional): The user-specified data type of the outputs.
+        session (:obj:`requests.Session`, optional): The session to fetch Internet resources through.
+            Defaults to a PooledSession that keeps up to `concurrency` connections alive per host.
+        **kwargs: Any other keyword arguments of `from_url`.
 
     Returns:
-        pandas.DataFrame: A pandas DataFrame represenation of the JSON resource.
+        dict: The parsable Python object representation (or the exception raised) for each URL.
     """
-    json = loads(resource.plaintext)
-    df = json_normalize(json)
-    return df
-
+    urls = list(dict.fromkeys(urls))  # Each URL is only retrieved once
+    own_session = session is None
+    if own_session:
+        session = PooledSession(pool_size=concurrency)
+    semaphore = Semaphore(concurrency)
+
+    async def worker(url, executor):
+        async with semaphore:
+            try:
+                return await async_from_url(url, out_type, executor=executor, session=session, **kwargs)
+            except Exception as e:
+                return e
 
-def csv_to_list(resource):
-    """
-    Helper function to convert CSV data to a list.
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = await gather(*(worker(url, executor) for url in urls))
+    finally:
+        if own_session:
+            session.close()
 
-    The end-user does not have to interface with this, but it is provided for more granular operations.
+    return dict(zip(urls, results))
 
-    Args:
-        resource (:obj:`Resource`): The Resource object for the CSV resource.
 
-    Returns:
-        list: A list represenation of the CSV resource.
+def _plan_conversions(in_types, out_type, options):
     """
-    rows = DictReader(resource.response)
-    return list(rows)
+    Helper function to run stage (4) of `from_url`: determine the possible conversions of the input types,
+    checking that the options are supported by at least one of them.
 
-
-def tsv_to_list(resource):
+    Raises:
+        TypeError: The input types cannot be converted into the output type, or an option is not supported.
     """
-    Helper function to convert TSV data to a list.
+    conversions = get_conversions(in_types, out_type)
+    supported = set(chain.from_iterable(CONVERSION_OPTIONS.get(in_type, ()) for in_type in in_types))
+    unsupported = set(options) - supported
+    if unsupported:
+        raise TypeError(f"The options {sorted(unsupported)} are not supported for the resource.")
+    return conversions
 
-    The end-user does not have to interface with this, but it is provided for more granular operations.
 
-    Args:
-        resource (:obj:`Resource`): The Resource object for the TSV resource.
+def _plan_resource(resource, out_type, in_type, options, stats=None):
+    """
+    Helper function to run stages (3) and (4) of `from_url` on a retrieved resource:
+    determine its input type, from a hint if there is one, and the possible conversions.
+    The resource is closed if it cannot be converted, so an unsupported Internet resource is abandoned
+    without downloading the rest of it.
 
     Returns:
-        list: A list represenation of the TSV resource.
+        tuple: The possible input types, the possible conversions, and whether the input types were hinted.
+
+    Raises:
+        TypeError: The resource cannot be converted into the output type, or an option is not supported.
     """
-    rows = DictReader(resource.response, delimiter="\t")
-    return list(rows)
+    try:
+        # (3) Determine input type, from a hint if there is one
+        with _stage(stats, "detect"):
+            in_types = hint_resource_types(resource, in_type)
+            hinted = in_types is not None
+            if not hinted:
+                in_types = get_resource_types(resource)
+        if stats is not None:
+            stats.candidates = in_types
+
+        # (4) Determine possible conversions
+        try:
+            with _stage(stats, "conversions"):
+                conversions = _plan_conversions(in_types, out_type, options)
+        except TypeError:
+            if not hinted or in_type is not None:
+                raise
+            # The input type guessed from the metadata cannot be converted as asked, so determine it from the data
+            with _stage(stats, "detect"):
+                in_types = get_resource_types(resource)
+            hinted = False
+            if stats is not None:
+                stats.candidates = in_types
+            with _stage(stats, "conversions"):
+                conversions = _plan_conversions(in_types, out_type, options)
+    except Exception:
+        resource.close()
+        raise
 
+    return in_types, conversions, hinted
 
-def xml_to_dict(resource):
+
+def _convert_resource(resource, in_types, conversions, hinted, out_type, options, stats=None):
     """
-    Helper function to convert XML data to a dictionary.
+    Helper function to run stage (5) of `from_url` on a planned resource (see `_plan_resource`), e.g. in another
+    process: convert it, falling back to determining the input type from the data if every hinted conversion fails.
+    """
+    try:
+        with _stage(stats, "convert"):
+            return convert(resource, conversions, stats, **options)
+    except TypeError:
+        if not hinted:
+            raise
+    # The hint was wrong, so fall back to determining the input type from the data
+    with _stage(stats, "detect"):
+        in_types = [t for t in get_resource_types(resource) if t not in in_types]
+    if stats is not None:
+        stats.candidates = in_types
+    with _stage(stats, "convert"):
+        return convert(resource, get_conversions(in_types, out_type), stats, **options)
+
+
+def from_urls(
+    urls, workers=None, executor="process", ordered=False, out_type=None, session=None, in_type=None, **options
+):
+    """
+    Converts the resource data at many URLs in parallel, yielding each result as soon as it is ready.
 
-    The end-user does not have to interface with this, but it is provided for more granular operations.
+    Internet resources are fetched in a pool of threads. With `executor="process"`, their input types are determined
+    there as by `from_url`, and only the CPU-bound conversion then runs in a pool of processes,
+    so that it is not serialized by the GIL (local files are read by the worker processes directly).
+    With `executor="thread"`, everything runs in the pool of threads, which avoids the cost of sending the data
+    between processes. Both executors give the same results.
+
+    A failure does not abort the batch: the exception is yielded in place of the result for that URL.
 
     Args:
-        resource (:obj:`Resource`): The Resource object for the XML resource.
+        urls (:obj:`Iterable`): The URLs to resources.
+        workers (int, optional): The number of threads and of processes. Defaults to the number of CPUs.
+        executor (str, optional): Either `"process"` or `"thread"`, as described above.
+        ordered (bool, optional): Whether to yield results in the order of `urls` rather than as they finish.
+        out_type (:obj:`class`, optional): The user-specified data type of the outputs.
+        session (:obj:`requests.Session`, optional): The session to fetch Internet resources through.
+            Defaults to a PooledSession that keeps up to `workers` connections alive per host.
+        in_type (:obj:`InputType`, optional): The user-specified input type of the resources (see `from_url`).
+        **options: Keyword options of the conversions (see `from_url`).
+
+    Yields:
+        tuple: The URL, and the parsable Python object representation of its resource (or the exception raised).
 
-    Returns:
-        dict: A dictionary represenation of the XML resource.
+    Raises:
+        ValueError: The executor is not supported, or the JSON backend is not installed.
+        TypeError: The user-specified data type of the output or input is not supported.
     """
-    rows = parse(resource.plaintext)
-    return rows
+    if executor not in ("process", "thread"):
+        raise ValueError(f"The executor {executor} is not supported.")
+    if out_type is not None and out_type not in OUTPUT_TYPES:
+        raise TypeError(f"The specified output type {out_type} is not supported.")
+    _check_in_type(in_type)
+    _check_json_backend(options.get("json_backend"))
+
+    return _from_urls(list(urls), workers or cpu_count() or 1, executor, ordered, out_type, session, in_type, options)
 
 
-def xlsx_to_dict(resource):
+def _from_urls(urls, workers, executor, ordered, out_type, session, in_type, options):
     """
-    Helper function to convert XLSX data to a dictionary.
+    Helper generator for `from_urls`, so that its arguments are validated when it is called.
     """
-    df = read_excel(resource.url, sheet_name=None)
-    sheets_dict = {}
-    for sheet_name, df in df.items():
-        sheets_dict[sheet_name] = df.to_dict()
-    return sheets_dict
+    own_session = session is None
+    if own_session:
+        session = PooledSession(pool_size=workers)
+    processes = ProcessPoolExecutor(workers) if executor == "process" else None
 
+    def task(url):
+        try:
+            connectivity = url_to_connectivity(url)
+            if processes is None:
+                return from_url(url, out_type, session=session, in_type=in_type, **options)
+            if connectivity is Connectivity.LOCAL:
+                return processes.submit(partial(from_url, url, out_type, in_type=in_type, **options)).result()
+
+            # Stages (2) to (4) of `from_url` run in this thread, so that only the conversion is sent to a process.
+            # The requests Response (and so the Resource) is picklable once its content has been read
+            resource = retrieve_resource(url, connectivity, stream=True, session=session)
+            in_types, conversions, hinted = _plan_resource(resource, out_type, in_type, options)
+            try:
+                resource.load()
+                plan = (in_types, conversions, hinted, out_type, options)
+                return processes.submit(_convert_resource, resource, *plan).result()
+            finally:
+                resource.close()
+        except Exception as e:
+            return e
 
-def convert(resource, conversions):
+    try:
+        with ThreadPoolExecutor(workers) as threads:
+            futures = {threads.submit(task, url): url for url in urls}
+            for future in futures if ordered else as_completed(futures):
+                yield futures[future], future.result()
+    finally:
+        if processes is not None:
+            processes.shutdown()
+        if own_session:
+            session.close()
+
+
+def _iter_and_close(resource, records):
     """
-    Attempts to convert the resource data through possible conversions.
+    Helper function to yield the records of a resource, releasing the resource once exhausted or closed.
+    """
+    try:
+        yield from records
+    finally:
+        resource.close()
 
-    The end-user does not have to interface with this, but it is provided for more granular operations.
 
-    Args:
-        resource (:obj:`Resource`): he Resource object for the resource.
-        conversions (list): The list of all possible conversions, filtered if user specified output data type.
+def _retrieve_stream(url, session, streamers, stats=None, in_type=None):
+    """
+    Helper function to retrieve a resource without reading its data, and determine its input type from a prefix.
 
     Returns:
-        object: The first successful conversion from the probable resource type to an output data type.
+        tuple: The Resource object, and its input type.
 
     Raises:
-        TypeError: None of the possible conversions were successful.
+        TypeError: The type of the resource is not one of the keys of `streamers`.
     """
-    for conversion in conversions:
-        try:
-            i_type, o_type = conversion
-            # Handle each case. Currently, only JSON has multiple options.
-            # Return the first conversion that works.
-            if i_type is InputType.JSON:
-                if o_type is dict:
-                    return json_to_dict(resource)
-                elif o_type is list:
-                    return json_to_list(resource)
-                elif o_type is DataFrame:
-                    return json_to_dataframe(resource)
-            elif i_type is InputType.CSV:
-                return csv_to_list(resource)
-            elif i_type is InputType.TSV:
-                return tsv_to_list(resource)
-            elif i_type is InputType.XML:
-                return xml_to_dict(resource)
-            elif i_type is InputType.XLSX:
-                return xlsx_to_dict(resource)
-        except Exception:
-            continue  # Try the next conversion
 
-    # Reach here means none of the conversions worked!
-    raise TypeError("The type of the resource is not supported.")
+    # (1) Get resource connectivity type
+    with _stage(stats, "connectivity"):
+        connectivity = url_to_connectivity(url)
 
+    # (2) Retrieve resource, without reading its data
+    with _stage(stats, "retrieve"):
+        resource = retrieve_resource(url, connectivity, stream=True, session=session)
 
-def from_url(url, out_type=None):
+    # (3) Determine input type
+    try:
+        with _stage(stats, "detect"):
+            in_types = hint_resource_types(resource, in_type) or get_resource_types(resource)
+        if stats is not None:
+            stats.candidates = in_types
+        in_type = in_types[0]
+        if in_type not in streamers:
+            raise TypeError(f"The resource type {in_type} cannot be streamed.")
+    except Exception:
+        resource.close()
+        raise
+
+    return resource, in_type
+
+
+def iter_url(url, record_path=None, session=None, sheet=None, in_type=None):
     """
-    This is the main interface that the end-user interacts with.
-        Given a URL, converts the resource data to a parsable Python object.
+    The streaming counterpart of `from_url`.
+        Given a URL, lazily yields the records of the resource data without reading it all into memory.
+
+    The input type is determined up front from a prefix of the resource,
+    so unsupported resources are reported before iteration starts.
 
     Args:
         url (str): A URL to a resource.
-        out_type (:obj:`class`, optional): The user-specified data type of the output.
+        record_path (str, optional): For XML resources, the slash-separated tag names leading from the root element
+            to the repeated record elements (e.g. `catalog/item`). Defaults to the children of the root element.
+        session (:obj:`requests.Session`, optional): The session to fetch Internet resources through.
+            Defaults to the shared PooledSession (see `get_session`).
+        sheet (str, optional): For XLSX resources, the name of the sheet to read rows from.
+            Defaults to the first sheet.
+        in_type (:obj:`InputType`, optional): The user-specified input type of the resource, which skips detection.
 
     Returns:
-        object: A parsable Python object representation of the resource.
+        iterator: An iterator over the records of the resource (e.g. a dict for each row of a CSV resource).
 
     Raises:
-        TypeError: The user-specified data type of the output is not supported.
+        TypeError: The type of the resource cannot be streamed.
     """
 
-    if out_type is not None and out_type not in OUTPUT_TYPES:
-        raise TypeError(f"The specified output type {out_type} is not supported.")
-
-    # (1) Get resource connectivity type
-    connectivity = url_to_connectivity(url)
-
-    # (2) Retrieve resource
-    resource = retrieve_resource(url, connectivity)
-
-    # (3) Determine input type
-    in_types = get_resource_types(resource)
-
-    # (4) Determine possible conversions
-    conversions = get_conversions(in_types, out_type)
+    _check_in_type(in_type)
 
-    # (5) Convert to output type
-    output = convert(resource, conversions)
+    # (1)-(3) Retrieve resource and determine input type
+    resource, in_type = _retrieve_stream(url, session, STREAMERS, in_type=in_type)
 
-    # (6) Close the file object if open()-ed
-    if connectivity is Connectivity.LOCAL:
-        resource.response.close()
+    try:
+        options = {}
+        if record_path is not None:
+            if in_type is not InputType.XML:
+                raise TypeError(f"A record path cannot be used with the resource type {in_type}.")
+            options["record_path"] = record_path
+        if sheet is not None:
+            if in_type is not InputType.XLSX:
+                raise TypeError(f"A sheet cannot be used with the resource type {in_type}.")
+            options["sheet"] = sheet
+        records = STREAMERS[in_type](resource, **options)
+    except Exception:
+        resource.close()
+        raise
 
-    return output
+    # (4) Stream records, closing the resource afterwards
+    return _iter_and_close(resource, records)
@@ -1,8 +1,38 @@
 import pyobjectify as pyob
 
-from pandas import DataFrame, json_normalize
+import asyncio
+import bz2
+from functools import partial
+import gzip
+import json
+from http.server import BaseHTTPRequestHandler, SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pandas import concat, DataFrame, json_normalize, read_parquet
+import lzma
+import mmap
+import numpy
 import os
+import pickle
+import shutil
+import tempfile
+import threading
 import unittest
+from unittest import mock
+
+try:
+    import pyarrow
+    from pyarrow import ipc, parquet
+except ImportError:
+    pyarrow = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 DIR = os.path.dirname(__file__) or "."
 
@@ -14,13 +44,60 @@ URL_CSV = f"{DIR}/data/example.csv"
 URL_TSV = f"{DIR}/data/example.tsv"
 URL_XML = f"{DIR}/data/example.xml"
 URL_XLSX = f"{DIR}/data/example.xlsx"
+URL_NDJSON = f"{DIR}/data/example.ndjson"
+URL_PARQUET = f"{DIR}/data/example.parquet"
+URL_ARROW = f"{DIR}/data/example.arrow"
 URL_OTHER = f"{DIR}/data/data.example"
+URL_JSON_ARRAY = f"{DIR}/data/test.json"
+URL_CSV_GZ = f"{DIR}/data/example.csv.gz"
 
 CONNECTIVITY_UNSUPPORTED = str
 OUTPUT_TYPE_UNSUPPORTED = str
 
 
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class DroppingRangeHandler(BaseHTTPRequestHandler):
+    """
+    Serves `body` with range support, but drops the connection halfway through every full response.
+    """
+
+    body = b""
+    ranges = []
+
+    def do_GET(self):
+        range_header = self.headers.get("Range")
+        self.ranges.append(range_header)
+        start = 0 if range_header is None else int(range_header[len("bytes=") : -1])
+        self.send_response(200 if range_header is None else 206)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(self.body) - start))
+        if range_header is not None:
+            self.send_header("Content-Range", f"bytes {start}-{len(self.body) - 1}/{len(self.body)}")
+        self.end_headers()
+        self.wfile.write(self.body[start:] if range_header is not None else self.body[: len(self.body) // 2])
+
+    def log_message(self, *args):
+        pass
+
+
 class TestPyobjectify(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # A local stand-in for static files on the Internet
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=f"{DIR}/data"))
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url_server = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
     def test_url_to_connectivity_local(self):
         actual = pyob.url_to_connectivity(URL_LOCAL)
         expected = pyob.Connectivity.LOCAL
@@ -41,10 +118,164 @@ class TestPyobjectify(unittest.TestCase):
         expected = pyob.Resource(URL_ONLINE_STATIC, pyob.Connectivity.ONLINE_STATIC)
         self.assertEqual(actual, expected)
 
+    def test_resource_local_mmap(self):
+        resource = pyob.Resource(URL_JSON, pyob.Connectivity.LOCAL)
+        self.assertIsInstance(resource.content, mmap.mmap)
+        self.assertIsNone(resource._plaintext)  # Decoded lazily
+        with open(URL_JSON) as file_obj:
+            self.assertEqual(resource.plaintext, file_obj.read())
+        resource.close()
+        self.assertTrue(resource.content.closed)
+
+    def test_resource_local_single_open(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = shutil.copy(URL_XLSX, directory)
+            resource = pyob.Resource(path, pyob.Connectivity.LOCAL)
+            os.remove(path)  # Everything is read from the memory map
+            actual = pyob.convert(resource, pyob.get_conversions(pyob.get_resource_types(resource)))
+        self.assertEqual(actual, pyob.from_url(URL_XLSX))
+        self.assertIsNone(resource.plaintext)
+
+    def test_resource_compressed(self):
+        compressors = {"gzip": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+        if zstandard is not None:
+            compressors["zstd"] = zstandard.ZstdCompressor().compress
+        with open(URL_CSV, "rb") as f:
+            data = f.read()
+        expected = pyob.from_url(URL_CSV, DataFrame)
+        with tempfile.TemporaryDirectory() as directory:
+            for name, compress in compressors.items():
+                path = os.path.join(directory, f"example.csv.{name}")
+                with open(path, "wb") as f:
+                    f.write(compress(data))
+                resource = pyob.Resource(path, pyob.Connectivity.LOCAL)
+                self.assertEqual(resource.compression, name)
+                self.assertIsNone(resource.content)  # The compressed data is never decompressed in full
+                self.assertEqual(resource.head(100), data[:100])
+                self.assertEqual(pyob.get_resource_types(resource)[0], pyob.InputType.CSV)
+                resource.close()
+                self.assertTrue(pyob.from_url(path, DataFrame).equals(expected))
+                self.assertEqual(len(list(pyob.iter_url(path))), len(expected))
+
+            # Binary input types are decompressed as well
+            path = os.path.join(directory, "example.xlsx.gz")
+            with open(URL_XLSX, "rb") as f, open(path, "wb") as g:
+                g.write(gzip.compress(f.read()))
+            self.assertEqual(pyob.from_url(path), pyob.from_url(URL_XLSX))
+            self.assertEqual(pyob.from_url(path, sheets="Sheet1"), pyob.from_url(URL_XLSX, sheets="Sheet1"))
+            self.assertEqual(list(pyob.iter_url(path)), list(pyob.iter_url(URL_XLSX)))
+
+    def test_resource_compressed_online(self):
+        actual = pyob.from_url(f"{self.url_server}/example.csv.gz", list)
+        self.assertEqual(actual, pyob.from_url(URL_CSV, list))
+        self.assertEqual(pyob.from_url(URL_CSV_GZ, list), actual)
+        self.assertEqual(list(pyob.iter_url(f"{self.url_server}/example.csv.gz")), actual)
+
+    def test_resource_compressed_multistream(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "example.ndjson.gz")
+            with open(path, "wb") as f:  # Concatenated gzip members, as written by appending to a log
+                f.write(gzip.compress(b'{"a": 1}\n{"a": 2}\n') + gzip.compress(b'{"a": 3}\n'))
+            self.assertEqual(pyob.from_url(path, list), [{"a": 1}, {"a": 2}, {"a": 3}])
+
+    def test_resource_compressed_truncated(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "example.json.gz")
+            with open(path, "wb") as f:
+                f.write(gzip.compress(b'{"a": 1}')[:-4])
+            resource = pyob.Resource(path, pyob.Connectivity.LOCAL)
+            with self.assertRaises(EOFError):
+                with resource.open_binary() as data:
+                    data.read()
+            resource.close()
+            with self.assertRaises(EOFError):
+                pyob.from_url(path)
+
+    def test_resource_spooled(self):
+        with mock.patch.object(pyob.pyobjectify, "SPOOL_SIZE", 1024):
+            resource = pyob.Resource(f"{self.url_server}/example.xlsx", pyob.Connectivity.ONLINE_STATIC)
+        self.assertIsInstance(resource.content, mmap.mmap)  # Spooled to a temporary file
+        with open(URL_XLSX, "rb") as file_obj:
+            self.assertEqual(resource.content[:], file_obj.read())
+        actual = pickle.loads(pickle.dumps(resource))  # As sent to worker processes by from_urls
+        self.assertEqual(actual.content, resource.content[:])
+        resource.close()
+        self.assertTrue(resource.content.closed)
+        self.assertEqual(pyob.convert(actual, pyob.get_conversions([pyob.InputType.XLSX])), pyob.from_url(URL_XLSX))
+
+    def test_resource_resumed(self):
+        with open(URL_CSV, "rb") as file_obj:
+            body = file_obj.read() * 64
+        handler = type("Handler", (DroppingRangeHandler,), {"body": body, "ranges": []})
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/example.csv"
+            resource = pyob.Resource(url, pyob.Connectivity.ONLINE_STATIC, session=pyob.PooledSession())
+            self.assertEqual(resource.content, body)
+            self.assertEqual(len(handler.ranges), 2)  # Resumed once, from the last chunk received in full
+            self.assertLessEqual(int(handler.ranges[1][len("bytes=") : -1]), len(body) // 2)
+            resource.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
     def test_retrieve_resource_online_error(self):
         with self.assertRaises(TypeError):
             pyob.retrieve_resource(URL_ONLINE_STATIC, CONNECTIVITY_UNSUPPORTED)
 
+    def test_pooled_session(self):
+        session = pyob.PooledSession(pool_size=4, retries=2, timeout=5)
+        adapter = session.get_adapter("https://example.com")
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertEqual(adapter.max_retries.total, 2)
+        assert "gzip" in session.headers["Accept-Encoding"]
+        with mock.patch("requests.Session.request") as request:
+            session.get(f"{self.url_server}/example.json")
+        self.assertEqual(request.call_args.kwargs["timeout"], 5)
+
+    def test_get_session(self):
+        self.assertIsInstance(pyob.get_session(), pyob.PooledSession)
+        self.assertIs(pyob.get_session(), pyob.get_session())
+
+    def test_from_url_session(self):
+        session = pyob.PooledSession()
+        with mock.patch.object(session, "request", wraps=session.request) as request:
+            actual = pyob.from_url(f"{self.url_server}/example.json", session=session)
+        self.assertEqual(request.call_count, 1)
+        self.assertEqual(actual, pyob.from_url(URL_JSON))
+
+    def test_http_cache_revalidation(self):
+        with tempfile.TemporaryDirectory() as directory:
+            session = pyob.PooledSession(cache=pyob.HTTPCache(directory))
+            first = session.get(f"{self.url_server}/example.csv")
+            second = session.get(f"{self.url_server}/example.csv")
+            self.assertFalse(first.from_cache)
+            self.assertTrue(second.from_cache)
+            self.assertEqual(second.status_code, 200)
+            self.assertEqual(second.content, first.content)
+            actual = pyob.from_url(f"{self.url_server}/example.csv", session=session)
+            self.assertEqual(actual, pyob.from_url(URL_CSV))
+
+    def test_http_cache_from_url(self):
+        with tempfile.TemporaryDirectory() as directory:
+            session = pyob.PooledSession(cache=pyob.HTTPCache(directory))
+            pyob.from_url(f"{self.url_server}/example.csv", session=session)  # Streamed, then stored once loaded
+            self.assertIsNotNone(session.cache.get(f"{self.url_server}/example.csv"))
+            self.assertTrue(session.get(f"{self.url_server}/example.csv").from_cache)
+
+    def test_http_cache_eviction(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = pyob.HTTPCache(directory, max_bytes=10, max_entries=2)
+            self.assertTrue(cache.store("http://a", {"ETag": '"a"'}, b"aaaa"))
+            self.assertTrue(cache.store("http://b", {"ETag": '"b"'}, b"bbbb"))
+            os.utime(cache._path("http://a", ".body"), (0, 0))  # Least recently used
+            self.assertTrue(cache.store("http://c", {"Last-Modified": "Mon, 01 May 2023 00:00:00 GMT"}, b"cccc"))
+            self.assertIsNone(cache.get("http://a"))
+            self.assertEqual(cache.get("http://b"), {"ETag": '"b"'})
+            self.assertFalse(cache.store("http://d", {}, b"d"))  # Cannot be revalidated
+            self.assertFalse(cache.store("http://e", {"ETag": '"e"'}, b"e" * 11))  # Too large
+
     def test_get_resource_types_json(self):
         resource = pyob.Resource(URL_JSON, pyob.Connectivity.LOCAL)
         actual = pyob.get_resource_types(resource)
@@ -70,11 +301,142 @@ class TestPyobjectify(unittest.TestCase):
         actual = pyob.get_resource_types(resource)
         assert pyob.InputType.XLSX in actual
 
+    def test_get_resource_types_ndjson(self):
+        resource = pyob.Resource(URL_NDJSON, pyob.Connectivity.LOCAL)
+        actual = pyob.get_resource_types(resource)
+        self.assertEqual(actual[0], pyob.InputType.NDJSON)
+
     def test_get_resource_types_error(self):
         resource = pyob.Resource(URL_OTHER, pyob.Connectivity.LOCAL)
         with self.assertRaises(TypeError):
             pyob.get_resource_types(resource)
 
+    def test_get_resource_types_ranked(self):
+        resource = pyob.Resource(URL_XLSX, pyob.Connectivity.LOCAL)
+        actual = pyob.get_resource_types(resource)
+        self.assertEqual(actual[0], pyob.InputType.XLSX)
+
+    def test_sniff_magic_bytes(self):
+        self.assertEqual(pyob.sniff(b"PK\x03\x04\x14\x00"), [pyob.InputType.XLSX])
+        self.assertEqual(pyob.sniff(b'\xef\xbb\xbf  [{"a": 1}]', truncated=False)[0], pyob.InputType.JSON)
+        self.assertEqual(pyob.sniff(b"<?xml version='1.0'?><a/>", truncated=False), [pyob.InputType.XML])
+
+    def test_sniff_delimiters(self):
+        actual = pyob.sniff(b"a\tb\tc\n1\t2\t3\n4\t5\t6\n", truncated=False)
+        self.assertEqual(actual, [pyob.InputType.TSV])
+        actual = pyob.sniff(b"a,b\n1,2\n3,4\n5,", truncated=True)  # Last record cut off by the prefix
+        self.assertEqual(actual, [pyob.InputType.CSV])
+
+    def test_sniff_unsupported(self):
+        self.assertEqual(pyob.sniff(b"Some data lives here.", truncated=False), [])
+
+    def test_from_url_json_scalar(self):
+        scalars = {b"42": 42, b'"hello"': "hello", b"true": True, b"null": None, b"-1.5": -1.5}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "scalar")
+            for data, expected in scalars.items():
+                with open(path, "wb") as f:
+                    f.write(data)
+                self.assertEqual(pyob.sniff(data, truncated=False)[0], pyob.InputType.JSON)
+                self.assertEqual(pyob.from_url(path), expected)
+
+    def test_from_url_ndjson_long_records(self):
+        records = [{"a": "x" * 70000}, {"a": "y" * 70000}]  # Each record is longer than SNIFF_SIZE
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "long.ndjson")
+            with open(path, "w") as f:
+                f.write("".join(json.dumps(record) + "\n" for record in records))
+            self.assertEqual(pyob.from_url(path), records)
+            os.rename(path, path[: -len(".ndjson")])  # Without the extension hint
+            self.assertEqual(pyob.from_url(path[: -len(".ndjson")], list), records)
+
+    def test_sniff_cost_order(self):
+        expensive = mock.Mock(return_value=0.5)
+        with mock.patch.dict(pyob.SNIFFERS, {"EXPENSIVE": expensive}), mock.patch.dict(
+            pyob.SNIFF_COSTS, {"EXPENSIVE": 10}
+        ):
+            self.assertEqual(pyob.sniff(b"PK\x03\x04\x14\x00"), [pyob.InputType.XLSX])
+            expensive.assert_not_called()  # The cheap magic bytes probe was certain
+            self.assertEqual(pyob.sniff(b"Some data lives here.", truncated=False), ["EXPENSIVE"])
+            expensive.assert_called_once()
+
+    def test_sniff_priority(self):
+        text = b'{"a": 1}'
+        self.assertEqual(pyob.sniff(text, truncated=False)[0], pyob.InputType.JSON)
+        with mock.patch.dict(pyob.SNIFFERS, {pyob.InputType.JSON: lambda prefix, text, truncated: 0.5}), mock.patch.dict(
+            pyob.SNIFF_PRIORITIES, {pyob.InputType.NDJSON: 1}
+        ):
+            self.assertEqual(pyob.sniff(text, truncated=False)[0], pyob.InputType.NDJSON)
+
+    def _kv_format(self, **kwargs):
+        def sniff_kv(prefix, text, truncated):
+            return 1.0 if text.startswith("#kv") else 0.0
+
+        def kv_to_dict(resource):
+            lines = resource.plaintext.splitlines()[1:]
+            return dict(line.split("=", 1) for line in lines if line)
+
+        # Restore the registries once the test is done
+        registries = (pyob.SNIFFERS, pyob.SNIFF_COSTS, pyob.SNIFF_PRIORITIES, pyob.CONVERSIONS, pyob.CONVERTERS)
+        for registry in registries + (pyob.EXTENSIONS, pyob.CONTENT_TYPES):
+            patch = mock.patch.dict(registry)
+            patch.start()
+            self.addCleanup(patch.stop)
+        return pyob.Format("KV", sniff_kv, {dict: kv_to_dict}, cost=0, **kwargs)
+
+    def test_register_format(self):
+        pyob.register_format(self._kv_format())
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "example.kv")
+            with open(path, "w") as f:
+                f.write("#kv\nborough=Manhattan\nindex=1\n")
+            self.assertEqual(pyob.from_url(path), {"borough": "Manhattan", "index": "1"})
+            with self.assertRaises(TypeError):
+                pyob.from_url(path, list)
+
+    def test_register_format_hints(self):
+        pyob.register_format(self._kv_format(extensions=["KV"], content_types=["text/x-kv"]))
+        self.assertEqual(pyob.EXTENSIONS[".kv"], "KV")
+        self.assertEqual(pyob.CONTENT_TYPES["text/x-kv"], "KV")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "example.kv")
+            with open(path, "w") as f:
+                f.write("#kv\nborough=Manhattan\n")
+            resource = pyob.Resource(path, pyob.Connectivity.LOCAL)
+            self.assertEqual(pyob.guess_input_type(resource), "KV")
+            with mock.patch.object(pyob.pyobjectify, "get_resource_types") as get_resource_types:
+                self.assertEqual(pyob.from_url(path), {"borough": "Manhattan"})
+            get_resource_types.assert_not_called()  # The extension was trusted, once the probe agreed
+            resource.close()
+
+    def test_register_format_error(self):
+        fmt = self._kv_format()
+        pyob.register_format(fmt)
+        with self.assertRaises(TypeError):
+            pyob.register_format(fmt)  # Already registered
+        with self.assertRaises(TypeError):
+            pyob.register_format(pyob.Format("SET", fmt.sniffer, {set: set}))
+        with self.assertRaises(TypeError):
+            pyob.register_format(pyob.Format("JSON5", fmt.sniffer, {dict: dict}, extensions=[".json"]))
+        self.assertNotIn("JSON5", pyob.SNIFFERS)  # Nothing is registered on error
+
+    def test_load_plugins(self):
+        entry_point = mock.Mock()
+        entry_point.name = "kv"
+        entry_point.load.return_value = self._kv_format
+        broken = mock.Mock()
+        broken.name = "broken"
+        broken.load.side_effect = ImportError("missing dependency")
+        with mock.patch.object(pyob.pyobjectify, "_plugins_loaded", False), mock.patch.object(
+            pyob.pyobjectify, "entry_points", return_value=[entry_point, broken]
+        ) as entry_points:
+            with self.assertWarns(UserWarning) as warning:
+                pyob.load_plugins()
+            pyob.load_plugins()  # Only loaded once
+        entry_points.assert_called_once_with(group=pyob.ENTRY_POINT_GROUP)
+        self.assertIn("broken", str(warning.warning))
+        self.assertIn("KV", pyob.SNIFFERS)
+
     def test_get_conversions_json(self):
         actual = pyob.get_conversions([pyob.InputType.JSON])
         expected = [(pyob.InputType.JSON, dict), (pyob.InputType.JSON, list), (pyob.InputType.JSON, DataFrame)]
@@ -82,12 +444,22 @@ class TestPyobjectify(unittest.TestCase):
 
     def test_get_conversions_csv(self):
         actual = pyob.get_conversions([pyob.InputType.CSV])
-        expected = [(pyob.InputType.CSV, list)]
+        expected = [
+            (pyob.InputType.CSV, list),
+            (pyob.InputType.CSV, DataFrame),
+            (pyob.InputType.CSV, dict),
+            (pyob.InputType.CSV, pyob.Rows),
+        ]
         self.assertEqual(actual, expected)
 
     def test_get_conversions_tsv(self):
         actual = pyob.get_conversions([pyob.InputType.TSV])
-        expected = [(pyob.InputType.TSV, list)]
+        expected = [
+            (pyob.InputType.TSV, list),
+            (pyob.InputType.TSV, DataFrame),
+            (pyob.InputType.TSV, dict),
+            (pyob.InputType.TSV, pyob.Rows),
+        ]
         self.assertEqual(actual, expected)
 
     def test_get_conversions_xml(self):
@@ -628,6 +1000,50 @@ class TestPyobjectify(unittest.TestCase):
         ]
         self.assertEqual(actual, expected)
 
+    def test_convert_csv_dataframe(self):
+        resource = pyob.Resource(URL_CSV, pyob.Connectivity.LOCAL)
+        actual = pyob.convert(resource, [(pyob.InputType.CSV, DataFrame)])
+        self.assertEqual(actual.shape, (13, 15))
+        self.assertEqual(actual["Postcode"].dtype, "int64")
+        self.assertEqual(actual["Latitude"].dtype, "float64")
+        self.assertEqual(actual["Borough"][0], "Bronx")
+
+    def test_convert_csv_dict(self):
+        resource = pyob.Resource(URL_CSV, pyob.Connectivity.LOCAL)
+        actual = pyob.convert(resource, [(pyob.InputType.CSV, dict)])
+        self.assertEqual(len(actual), 15)
+        self.assertIsInstance(actual["Postcode"], numpy.ndarray)
+        self.assertEqual(actual["Postcode"].dtype, "int64")
+        self.assertTrue(actual["Postcode"].flags.c_contiguous)
+        self.assertEqual(actual["Postcode"][0], 10458)
+
+    def test_convert_csv_rows(self):
+        resource = pyob.Resource(URL_CSV, pyob.Connectivity.LOCAL)
+        actual = pyob.convert(resource, [(pyob.InputType.CSV, pyob.Rows)])
+        self.assertEqual(actual, pyob.from_url(URL_CSV))
+        self.assertEqual(actual.header[:3], ["Borough", "Postcode", "Phone"])
+        self.assertEqual(actual[0]["Borough"], "Bronx")
+        self.assertIs(actual[0]._index, actual[1]._index)  # The header is shared
+        with self.assertRaises(AttributeError):
+            actual[0].extra = None  # No per-row dictionary
+
+    def test_row_ragged(self):
+        rows = pyob.Rows(["a", "b"], [["1"], ["1", "2", "3", "4"]])
+        self.assertEqual(rows[0], {"a": "1", "b": None})
+        self.assertEqual(rows[1], {"a": "1", "b": "2", None: ["3", "4"]})
+
+    def test_from_url_tsv_rows(self):
+        actual = pyob.from_url(URL_TSV, pyob.Rows)
+        self.assertIsInstance(actual, pyob.Rows)
+        self.assertEqual(actual, pyob.from_url(URL_TSV))
+
+    def test_convert_tsv_dataframe(self):
+        resource = pyob.Resource(URL_TSV, pyob.Connectivity.LOCAL)
+        actual = pyob.convert(resource, [(pyob.InputType.TSV, DataFrame)])
+        expected = pyob.from_url(URL_CSV, DataFrame)
+        self.assertEqual(list(actual["Phone"]), list(expected["Phone"]))
+        self.assertEqual(actual["Census Tract"].dtype, "int64")
+
     def test_convert_xml_dict(self):
         resource = pyob.Resource(URL_XML, pyob.Connectivity.LOCAL)
         actual = pyob.convert(resource, [(pyob.InputType.XML, dict)])
@@ -932,6 +1348,33 @@ class TestPyobjectify(unittest.TestCase):
         }
         self.assertEqual(actual, expected)
 
+    def test_convert_ndjson_list(self):
+        resource = pyob.Resource(URL_NDJSON, pyob.Connectivity.LOCAL)
+        actual = pyob.convert(resource, [(pyob.InputType.NDJSON, list)])
+        self.assertEqual(len(actual), 3)
+        self.assertEqual(actual[1]["page"], {"path": "/data", "title": "Data"})
+
+    def test_convert_ndjson_dataframe(self):
+        resource = pyob.Resource(URL_NDJSON, pyob.Connectivity.LOCAL)
+        actual = pyob.convert(resource, [(pyob.InputType.NDJSON, DataFrame)])
+        self.assertEqual(list(actual["user"]), ["alice", "alice", "bob"])
+        assert "page.path" in actual.columns
+
+    def test_convert_parses_once(self):
+        resource = pyob.Resource(URL_JSON, pyob.Connectivity.LOCAL)
+        as_dict = pyob.convert(resource, [(pyob.InputType.JSON, dict)])
+        as_list = pyob.convert(resource, [(pyob.InputType.JSON, list)])
+        self.assertIs(as_list[0], as_dict)
+        self.assertEqual(list(resource.parsed), [pyob.InputType.JSON])
+
+    def test_resource_parse_failure_cached(self):
+        resource = pyob.Resource(URL_OTHER, pyob.Connectivity.LOCAL)
+        with self.assertRaises(ValueError):
+            resource.parse(pyob.InputType.JSON)
+        self.assertIsInstance(resource.parsed[pyob.InputType.JSON], ValueError)
+        with self.assertRaises(ValueError):
+            resource.parse(pyob.InputType.JSON)
+
     def test_convert_error(self):
         resource = pyob.Resource(URL_JSON, pyob.Connectivity.LOCAL)
         with self.assertRaises(TypeError):
@@ -955,6 +1398,506 @@ class TestPyobjectify(unittest.TestCase):
         with self.assertRaises(TypeError):
             pyob.from_url(URL_JSON, OUTPUT_TYPE_UNSUPPORTED)
 
+    def test_from_url_result_cache(self):
+        cache = pyob.ResultCache()
+        first = pyob.from_url(URL_JSON, result_cache=cache)
+        with mock.patch.object(pyob.pyobjectify, "retrieve_resource") as retrieve_resource:
+            second = pyob.from_url(URL_JSON, result_cache=cache)
+        retrieve_resource.assert_not_called()
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(second, first)
+        second["quiz"].clear()  # Callers get their own copy
+        self.assertEqual(pyob.from_url(URL_JSON, result_cache=cache), first)
+        pyob.from_url(URL_JSON, list, result_cache=cache)  # The output type is part of the key
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (2, 2, 2))
+
+    def test_from_url_result_cache_online_static(self):
+        cache = pyob.ResultCache(mode="readonly")
+        first = pyob.from_url(f"{self.url_server}/example.csv", result_cache=cache)
+        second = pyob.from_url(f"{self.url_server}/example.csv", result_cache=cache)
+        self.assertIs(second, first)
+        self.assertIsInstance(first, tuple)
+        self.assertEqual(first[0]["Borough"], "Bronx")
+        with self.assertRaises(TypeError):
+            first[0]["Borough"] = "Queens"
+
+    def test_from_url_result_cache_in_type(self):
+        for url in (URL_TSV, f"{self.url_server}/example.tsv"):
+            cache = pyob.ResultCache()
+            tsv = pyob.from_url(url, list, in_type=pyob.InputType.TSV, result_cache=cache)
+            csv = pyob.from_url(url, list, in_type=pyob.InputType.CSV, result_cache=cache)
+            self.assertEqual(csv, pyob.from_url(url, list, in_type=pyob.InputType.CSV))  # Not the TSV rows
+            self.assertNotEqual(csv, tsv)
+            self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_result_cache_readonly_columns(self):
+        cache = pyob.ResultCache(mode="readonly")
+        first = pyob.from_url(URL_CSV, dict, result_cache=cache)
+        with self.assertRaises(ValueError):  # Columns are read-only views of the cached arrays
+            first["Borough"][0] = "Queens"
+        self.assertEqual(pyob.from_url(URL_CSV, dict, result_cache=cache)["Borough"][0], "Bronx")
+        self.assertEqual(cache.hits, 1)
+
+        rows = pyob.from_url(URL_CSV, pyob.Rows, result_cache=cache)
+        self.assertIsInstance(rows, pyob.Rows)  # Still the requested output type
+        self.assertEqual(rows.header[0], "Borough")
+        with self.assertRaises(TypeError):
+            rows[0]["Borough"] = "Queens"
+        rows.clear()
+        rows.header.clear()
+        cached = pyob.from_url(URL_CSV, pyob.Rows, result_cache=cache)
+        self.assertIsInstance(cached, pyob.Rows)
+        self.assertEqual((cached.header[0], cached[0]["Borough"]), ("Borough", "Bronx"))
+        self.assertEqual(cache.hits, 2)
+
+    def test_guess_input_type(self):
+        guesses = {
+            URL_CSV: pyob.InputType.CSV,
+            URL_CSV_GZ: pyob.InputType.CSV,
+            URL_OTHER: None,
+            f"{self.url_server}/example.NDJSON?version=2": pyob.InputType.NDJSON,
+            f"{self.url_server}/data.example?format=.csv": None,
+        }
+        for url, expected in guesses.items():
+            resource = pyob.Resource(url, pyob.url_to_connectivity(url), stream=True)
+            self.assertEqual(pyob.guess_input_type(resource), expected)
+            resource.close()
+
+    def test_guess_input_type_content_type(self):
+        content_types = {
+            "application/json; charset=utf-8": pyob.InputType.JSON,
+            "application/geo+json": pyob.InputType.JSON,
+            "Text/CSV": pyob.InputType.CSV,
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": pyob.InputType.XLSX,
+            "text/plain": pyob.InputType.NDJSON,  # Ambiguous, so the file extension decides
+        }
+        for content_type, expected in content_types.items():
+            resource = pyob.Resource(f"{self.url_server}/example.ndjson", pyob.Connectivity.ONLINE_STATIC, stream=True)
+            resource.response.headers["Content-Type"] = content_type
+            self.assertEqual(pyob.guess_input_type(resource), expected)
+            resource.close()
+
+    def test_from_url_content_type(self):
+        stats = pyob.Stats()
+        with mock.patch.object(pyob.pyobjectify, "get_resource_types") as get_resource_types:
+            actual = pyob.from_url(f"{self.url_server}/example.json", stats=stats)  # Served as application/json
+            get_resource_types.assert_not_called()
+        self.assertEqual(actual, pyob.from_url(URL_JSON))
+        self.assertEqual(stats.candidates, [pyob.InputType.JSON])
+
+    def test_from_url_in_type(self):
+        with mock.patch.object(pyob.pyobjectify, "get_resource_types") as get_resource_types:
+            actual = pyob.from_url(URL_CSV, DataFrame, in_type=pyob.InputType.CSV)
+            get_resource_types.assert_not_called()
+        self.assertTrue(actual.equals(pyob.from_url(URL_CSV, DataFrame)))
+        # A user-specified input type is trusted, even over the data
+        actual = pyob.from_url(URL_TSV, list, in_type=pyob.InputType.CSV)
+        self.assertIn("Borough\tPostcode", list(actual[0])[0])
+        with self.assertRaises(TypeError):
+            pyob.from_url(URL_CSV, in_type="CSV")
+
+    def test_from_url_in_type_fallback(self):
+        stats = pyob.Stats()
+        actual = pyob.from_url(URL_NDJSON, list, in_type=pyob.InputType.JSON, stats=stats)
+        self.assertEqual(actual, pyob.from_url(URL_NDJSON, list))
+        self.assertEqual(stats.conversion, (pyob.InputType.NDJSON, list))
+        with tempfile.TemporaryDirectory() as directory:
+            path = shutil.copy(URL_NDJSON, os.path.join(directory, "example.json"))  # A misleading extension
+            self.assertEqual(pyob.from_url(path, list), actual)
+            path = shutil.copy(URL_TSV, os.path.join(directory, "example.csv"))
+            self.assertTrue(pyob.from_url(path, DataFrame).equals(pyob.from_url(URL_TSV, DataFrame)))
+
+    def test_from_url_closes_on_error(self):
+        with mock.patch.object(pyob.Resource, "close", autospec=True) as close:
+            with self.assertRaises(TypeError):
+                pyob.from_url(URL_JSON, pyob.Rows)  # No conversion
+            with mock.patch.object(pyob.pyobjectify, "convert", side_effect=TypeError):
+                with self.assertRaises(TypeError):
+                    pyob.from_url(URL_CSV)  # Every conversion fails
+        self.assertEqual(close.call_count, 2)
+
+    def test_from_url_guess_fallback(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "one.jsonl")
+            with open(path, "w") as f:
+                f.write('{"a": 1}\n')
+            stats = pyob.Stats()
+            self.assertEqual(pyob.from_url(path, dict, stats=stats), {"a": 1})  # NDJSON cannot be a dict
+            self.assertEqual(stats.conversion, (pyob.InputType.JSON, dict))
+            with self.assertRaises(TypeError):
+                pyob.from_url(path, dict, in_type=pyob.InputType.NDJSON)  # A given input type is trusted
+
+    def test_from_url_stats(self):
+        calls = []
+        stats = pyob.Stats(hooks=[lambda stage, seconds, stats: calls.append(stage)])
+        actual = pyob.from_url(URL_CSV, DataFrame, stats=stats)
+        self.assertTrue(actual.equals(pyob.from_url(URL_CSV, DataFrame)))
+        stages = ["connectivity", "retrieve", "detect", "conversions", "convert", "close"]
+        self.assertEqual(list(stats.stages), stages)
+        self.assertEqual(calls, stages)
+        self.assertTrue(all(seconds >= 0 for seconds in stats.stages.values()))
+        self.assertAlmostEqual(stats.total, sum(stats.stages.values()))
+        self.assertEqual(stats.bytes_read, os.path.getsize(URL_CSV))
+        self.assertEqual(stats.candidates[0], pyob.InputType.CSV)
+        self.assertEqual(stats.conversion, (pyob.InputType.CSV, DataFrame))
+        self.assertEqual(stats.rejected, [])
+        self.assertFalse(stats.cache_hit)
+
+    def test_from_url_stats_online_static(self):
+        stats = pyob.Stats()
+        actual = pyob.from_url(f"{self.url_server}/example.csv", DataFrame, stats=stats)
+        self.assertTrue(actual.equals(pyob.from_url(URL_CSV, DataFrame)))
+        stages = ["connectivity", "retrieve", "detect", "conversions", "load", "convert", "close"]
+        self.assertEqual(list(stats.stages), stages)
+        self.assertEqual(stats.bytes_read, os.path.getsize(URL_CSV))
+
+    def test_from_url_online_static_unsupported(self):
+        stats = pyob.Stats()
+        with mock.patch.object(pyob.Resource, "load", autospec=True) as load:
+            with self.assertRaises(TypeError):
+                pyob.from_url(f"{self.url_server}/data.example", stats=stats)
+            with self.assertRaises(TypeError):
+                pyob.from_url(f"{self.url_server}/example.json", out_type=pyob.Rows)
+        load.assert_not_called()  # Only the prefix of the response was read
+        self.assertEqual(list(stats.stages), ["connectivity", "retrieve", "detect"])
+
+    def test_from_url_stats_hooks_per_run(self):
+        calls = []
+        stats = pyob.Stats(hooks=[lambda stage, seconds, stats: calls.append((stage, seconds))])
+        with mock.patch.object(pyob.pyobjectify, "perf_counter", side_effect=[0.0, 1.0, 1.0, 3.0]):
+            for _ in range(2):
+                with stats.stage("detect"):
+                    pass
+        self.assertEqual(calls, [("detect", 1.0), ("detect", 2.0)])  # Each run, not the running total
+        self.assertEqual(stats.stages["detect"], 3.0)
+
+    def test_from_url_stats_rejected(self):
+        error = ValueError("broken")
+        stats = pyob.Stats()
+        with mock.patch.dict(pyob.CONVERTERS, {(pyob.InputType.JSON, dict): mock.Mock(side_effect=error)}):
+            pyob.from_url(URL_JSON, stats=stats)
+        self.assertEqual(stats.rejected, [((pyob.InputType.JSON, dict), error)])
+        self.assertEqual(stats.conversion, (pyob.InputType.JSON, list))
+
+    def test_from_url_stats_cache_hit(self):
+        cache = pyob.ResultCache()
+        pyob.from_url(URL_JSON, result_cache=cache)
+        stats = pyob.Stats()
+        pyob.from_url(URL_JSON, result_cache=cache, stats=stats)
+        self.assertTrue(stats.cache_hit)
+        self.assertEqual(list(stats.stages), ["connectivity", "cache"])
+
+    def test_from_url_stats_tracer(self):
+        spans = []
+        tracer = mock.Mock()
+        tracer.start_as_current_span.side_effect = lambda name: spans.append(name) or mock.MagicMock()
+        pyob.from_url(f"{self.url_server}/example.json", stats=pyob.Stats(tracer=tracer))
+        self.assertEqual(spans[:3], ["pyobjectify.connectivity", "pyobjectify.retrieve", "pyobjectify.detect"])
+
+    def test_from_url_stats_chunksize(self):
+        stats = pyob.Stats()
+        chunks = pyob.from_url(URL_CSV, chunksize=5, stats=stats)
+        self.assertEqual(list(stats.stages), ["connectivity", "retrieve", "detect"])
+        self.assertIsNone(stats.bytes_read)  # The resource is streamed
+        self.assertEqual(sum(len(df) for df in chunks), 13)
+
+    def test_result_cache_eviction(self):
+        cache = pyob.ResultCache(max_entries=2, max_bytes=10)
+        cache.put("a", 1, 4)
+        cache.put("b", 2, 4)
+        cache.get("a")
+        cache.put("c", 3, 4)  # Evicts "b", the least recently used
+        self.assertEqual(cache.get("a"), 1)
+        with self.assertRaises(KeyError):
+            cache.get("b")
+        cache.put("d", 4, 11)  # Too large to keep
+        self.assertEqual((len(cache), cache.nbytes), (2, 8))
+        with self.assertRaises(ValueError):
+            pyob.ResultCache(mode="shared")
+
+    def test_from_url_chunksize_csv(self):
+        actual = list(pyob.from_url(URL_CSV, DataFrame, chunksize=5))
+        self.assertEqual([len(df) for df in actual], [5, 5, 3])
+        expected = pyob.from_url(URL_CSV, DataFrame)
+        assert DataFrame.compare(concat(actual), expected).empty
+
+    def test_from_url_chunksize_json(self):
+        actual = list(pyob.from_url(f"{self.url_server}/test.json", chunksize=2))
+        expected = json_normalize(pyob.from_url(URL_JSON_ARRAY, list))
+        self.assertEqual([len(df) for df in actual], [2, 2, 1])
+        assert DataFrame.compare(concat(actual), expected).empty
+
+    def test_from_url_chunksize_ndjson(self):
+        actual = list(pyob.from_url(URL_NDJSON, chunksize=2))
+        self.assertEqual([list(df.index) for df in actual], [[0, 1], [2]])
+        self.assertEqual(list(concat(actual)["user"]), ["alice", "alice", "bob"])
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_from_url_chunksize_parquet(self):
+        actual = list(pyob.from_url(URL_PARQUET, chunksize=4))  # Row groups of 5 rows are regrouped
+        self.assertEqual([len(df) for df in actual], [4, 4, 4, 1])
+        self.assertEqual(list(actual[-1].index), [12])
+        self.assertTrue(concat(actual).equals(read_parquet(URL_PARQUET)))
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_from_url_chunksize_options(self):
+        actual = concat(pyob.from_url(URL_PARQUET, chunksize=4, columns=["Borough"], row_groups=[1, 2]))
+        expected = read_parquet(URL_PARQUET, columns=["Borough"]).iloc[5:].reset_index(drop=True)
+        self.assertTrue(actual.equals(expected))
+        actual = concat(pyob.from_url(URL_ARROW, chunksize=4, columns=["Borough"]))
+        self.assertEqual(list(actual.columns), ["Borough"])
+        self.assertEqual(len(actual), len(pyob.from_url(URL_ARROW, DataFrame)))
+        with self.assertRaises(TypeError):
+            pyob.from_url(URL_PARQUET, chunksize=2, bogus=1)
+
+    def test_from_url_chunksize_error(self):
+        with self.assertRaises(TypeError):
+            pyob.from_url(URL_CSV, list, chunksize=5)
+        with self.assertRaises(TypeError):
+            pyob.from_url(URL_CSV, chunksize=5, columns=["Borough"])  # Not an option of CSV conversions
+        actual = pyob.from_url(URL_NDJSON, chunksize=5, json_backend="json")
+        self.assertTrue(concat(actual).equals(concat(pyob.from_url(URL_NDJSON, chunksize=5))))
+        with self.assertRaises(TypeError):
+            pyob.from_url(URL_XML, chunksize=5)
+        with self.assertRaises(ValueError):
+            pyob.from_url(URL_CSV, chunksize=0)
+
+    def test_async_from_url(self):
+        actual = asyncio.run(pyob.async_from_url(f"{self.url_server}/example.json", list))
+        self.assertEqual(actual, pyob.from_url(URL_JSON, list))
+
+    def test_gather_urls(self):
+        urls = [f"{self.url_server}/example.{ext}" for ext in ("json", "csv", "xml", "missing")] + [URL_TSV]
+        actual = asyncio.run(pyob.gather_urls(urls, concurrency=2))
+        self.assertEqual(list(actual), urls)
+        self.assertEqual(actual[urls[0]], pyob.from_url(URL_JSON))
+        self.assertEqual(actual[urls[1]], pyob.from_url(URL_CSV))
+        self.assertEqual(actual[urls[2]], pyob.from_url(URL_XML))
+        self.assertIsInstance(actual[urls[3]], TypeError)  # The 404 page is not a supported type
+        self.assertEqual(actual[URL_TSV], pyob.from_url(URL_TSV))
+
+    def test_from_urls(self):
+        urls = [f"{self.url_server}/example.json", URL_CSV, f"{self.url_server}/example.xlsx", URL_OTHER, URL_XML]
+        for executor in ("process", "thread"):
+            actual = list(pyob.from_urls(urls, workers=2, executor=executor, ordered=True))
+            self.assertEqual([url for url, _ in actual], urls)
+            self.assertEqual(actual[0][1], pyob.from_url(URL_JSON))
+            self.assertEqual(actual[1][1], pyob.from_url(URL_CSV))
+            self.assertEqual(actual[2][1], pyob.from_url(URL_XLSX))
+            self.assertIsInstance(actual[3][1], TypeError)
+            self.assertEqual(actual[4][1], pyob.from_url(URL_XML))
+
+    def test_from_urls_executors_agree(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "one.ndjson"), "w") as f:
+                f.write('{"a": 1}\n')
+            server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=directory))
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            try:
+                url = f"http://127.0.0.1:{server.server_address[1]}/one.ndjson"
+                expected = pyob.from_url(url)
+                self.assertEqual(expected, [{"a": 1}])  # Hinted by the extension
+                for executor in ("process", "thread"):
+                    self.assertEqual(list(pyob.from_urls([url], workers=1, executor=executor)), [(url, expected)])
+                    actual = pyob.from_urls([url, URL_NDJSON], workers=1, executor=executor, json_backend="json")
+                    self.assertEqual(dict(actual), {url: expected, URL_NDJSON: pyob.from_url(URL_NDJSON)})
+                    actual = pyob.from_urls([url], workers=1, executor=executor, in_type=pyob.InputType.JSON)
+                    self.assertEqual(list(actual), [(url, {"a": 1})])
+            finally:
+                server.shutdown()
+                server.server_close()
+
+    def test_from_urls_unordered(self):
+        actual = dict(pyob.from_urls([URL_JSON, URL_TSV], executor="thread", out_type=list))
+        self.assertEqual(actual, {URL_JSON: pyob.from_url(URL_JSON, list), URL_TSV: pyob.from_url(URL_TSV)})
+
+    def test_from_urls_error(self):
+        with self.assertRaises(ValueError):
+            pyob.from_urls([URL_JSON], executor="fiber")
+
+    def test_iter_url_csv(self):
+        actual = pyob.iter_url(URL_CSV)
+        self.assertNotIsInstance(actual, list)
+        self.assertEqual(list(actual), pyob.from_url(URL_CSV))
+
+    def test_iter_url_online_static(self):
+        actual = list(pyob.iter_url(f"{self.url_server}/example.tsv"))
+        self.assertEqual(actual, pyob.from_url(URL_TSV))
+
+    def test_iter_url_json_array(self):
+        expected = pyob.from_url(URL_JSON_ARRAY, list)
+        with mock.patch.object(pyob.pyobjectify, "CHUNK_SIZE", 16):  # Elements straddle many reads
+            actual = pyob.iter_url(URL_JSON_ARRAY)
+            self.assertEqual(next(actual), expected[0])
+            self.assertEqual([expected[0]] + list(actual), expected)
+
+    def test_iter_url_json_trailing_data(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trailing.json")
+            with open(path, "w") as f:
+                f.write("[1, 2]" + " " * 40 + "garbage\n")
+            with mock.patch.object(pyob.pyobjectify, "CHUNK_SIZE", 16):  # The garbage is past the final "]" read
+                with self.assertRaises(ValueError):
+                    list(pyob.iter_url(path))
+            with open(path, "w") as f:
+                f.write("[1, 2]  \n\n")
+            self.assertEqual(list(pyob.iter_url(path)), [1, 2])
+
+    def test_iter_url_json_object(self):
+        actual = list(pyob.iter_url(URL_JSON))
+        self.assertEqual(actual, [pyob.from_url(URL_JSON)])
+
+    def test_iter_url_ndjson(self):
+        actual = list(pyob.iter_url(f"{self.url_server}/example.ndjson"))
+        self.assertEqual(actual, pyob.from_url(URL_NDJSON))
+
+    def test_iter_url_xml_record_path(self):
+        expected = pyob.from_url(URL_XML)["response"]["row"]["row"]
+        actual = pyob.iter_url(URL_XML, record_path="response/row/row")
+        self.assertEqual(list(actual), expected)
+
+    def test_iter_url_xml_default(self):
+        expected = pyob.from_url(URL_XML)["response"]["row"]
+        actual = pyob.iter_url(f"{self.url_server}/example.xml")
+        self.assertEqual(list(actual), [expected])
+
+    def test_iter_url_xml_namespaces(self):
+        document = (
+            '<x:root xmlns:x="urn:x" xmlns="urn:d">'
+            '<x:item a="1" x:b="2" xml:lang="en"><name>One</name><y:v xmlns:y="urn:y">3</y:v></x:item>'
+            '<x:item a="2"><name>Two</name></x:item>'
+            '<other xmlns="urn:o"><name>Three</name></other>'
+            "</x:root>"
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "namespaces.xml")
+            with open(path, "w") as f:
+                f.write(document)
+            expected = pyob.from_url(path)["x:root"]
+            self.assertEqual(list(pyob.iter_url(path)), expected["x:item"] + [expected["other"]])
+            self.assertEqual(list(pyob.iter_url(path, record_path="root/item")), expected["x:item"])
+            self.assertEqual(list(pyob.iter_url(path, record_path="x:root/x:item")), expected["x:item"])
+
+    def test_iter_url_record_path_error(self):
+        with self.assertRaises(TypeError):
+            pyob.iter_url(URL_CSV, record_path="response/row")
+
+    def test_iter_url_xlsx(self):
+        records = list(pyob.iter_url(URL_XLSX, sheet="Sheet1"))
+        self.assertEqual(records[0], {"Abbreviation": "MN", "Borough": "Manhattan", "Index": 1})
+        self.assertEqual(records, list(pyob.iter_url(URL_XLSX)))
+
+    def test_iter_url_error(self):
+        with self.assertRaises(TypeError):
+            pyob.iter_url(URL_OTHER)
+        with self.assertRaises(TypeError):
+            pyob.iter_url(URL_CSV, sheet="Sheet1")
+
+    def test_decode_json(self):
+        document = '{"a": [1, 2.5, null, true], "b": {"c": "\\u00e9"}}'
+        for backend in pyob.JSON_BACKENDS:
+            self.assertEqual(pyob.decode_json(document.encode(), backend), json.loads(document))
+            self.assertEqual(pyob.decode_json(document, backend), json.loads(document))
+        with self.assertRaises(ValueError):
+            pyob.decode_json(b"[1,", "json")
+        with self.assertRaises(ValueError):
+            pyob.decode_json(b"[]", "unknown")
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_decode_json_fallback(self):
+        document = b'[123456789012345678901234567890, "\\ud800", 1]'  # orjson rejects both the integer and surrogate
+        self.assertEqual(pyob.decode_json(document, "orjson"), json.loads(document))
+        self.assertEqual(pyob.decode_json('{"a": 1}'.encode("utf-16"), "orjson"), {"a": 1})
+        with self.assertRaises(json.JSONDecodeError):  # The error of the json module
+            pyob.decode_json(b"[1,", "orjson")
+
+    def test_from_url_json_backend(self):
+        backend = mock.Mock(wraps=json.loads)
+        with mock.patch.dict(pyob.JSON_BACKENDS, {"fake": backend}):
+            pyob.set_json_backend("fake")
+            try:
+                actual = pyob.from_url(URL_NDJSON)
+            finally:
+                pyob.set_json_backend()
+            self.assertTrue(backend.called)
+            backend.reset_mock()
+            self.assertEqual(pyob.from_url(URL_NDJSON, json_backend="fake"), actual)
+            self.assertTrue(backend.called)
+        self.assertEqual(actual, pyob.from_url(URL_NDJSON))
+        self.assertEqual(pyob.from_url(URL_JSON, list, json_backend="json"), pyob.from_url(URL_JSON, list))
+        with self.assertRaises(ValueError):
+            pyob.set_json_backend("unknown")
+        with self.assertRaises(ValueError):
+            pyob.from_url(URL_JSON, json_backend="unknown")
+        with self.assertRaises(TypeError):
+            pyob.from_url(URL_CSV, json_backend="json")  # Not an option of CSV conversions
+
+    def test_from_url_xlsx_sheets(self):
+        full = pyob.from_url(URL_XLSX)
+        self.assertEqual(pyob.from_url(URL_XLSX, sheets="Sheet2"), {"Sheet2": full["Sheet2"]})
+
+    def test_from_url_xlsx_lazy(self):
+        sheets = pyob.from_url(URL_XLSX, lazy=True)
+        self.assertIsInstance(sheets, pyob.LazySheets)
+        self.assertEqual(sheets._sheets, {})
+        self.assertEqual(dict(sheets), pyob.from_url(URL_XLSX))
+        sheets.close()
+
+    def test_from_url_options_error(self):
+        with self.assertRaises(TypeError):
+            pyob.from_url(URL_CSV, sheets="Sheet1")
+
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_sniff_parquet_arrow(self):
+        with open(URL_PARQUET, "rb") as f:
+            self.assertEqual(pyob.sniff(f.read(64)), [pyob.InputType.PARQUET])
+        with open(URL_ARROW, "rb") as f:
+            self.assertEqual(pyob.sniff(f.read(64)), [pyob.InputType.ARROW])
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_from_url_parquet(self):
+        expected = read_parquet(URL_PARQUET)
+        self.assertTrue(pyob.from_url(URL_PARQUET).equals(expected))
+        self.assertTrue(pyob.from_url(f"{self.url_server}/example.parquet").equals(expected))
+        self.assertEqual(pyob.from_url(URL_PARQUET, list), parquet.read_table(URL_PARQUET).to_pylist())
+        actual = pyob.from_url(URL_PARQUET, dict)
+        self.assertEqual(list(actual), list(expected.columns))
+        numpy.testing.assert_array_equal(actual["Latitude"], expected["Latitude"].to_numpy())
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_from_url_parquet_projection(self):
+        expected = read_parquet(URL_PARQUET, columns=["Borough", "Postcode"])
+        actual = pyob.from_url(URL_PARQUET, columns=["Borough", "Postcode"])
+        self.assertTrue(actual.equals(expected))
+        actual = pyob.from_url(URL_PARQUET, list, columns=["Postcode"], row_groups=[1])
+        self.assertEqual(actual, [{"Postcode": postcode} for postcode in expected["Postcode"][5:10]])
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_from_url_arrow(self):
+        expected = read_parquet(URL_PARQUET)
+        self.assertTrue(pyob.from_url(URL_ARROW).equals(expected))
+        self.assertTrue(pyob.from_url(f"{self.url_server}/example.arrow").equals(expected))
+        self.assertEqual(pyob.from_url(URL_ARROW, list, columns=["Borough"]), [{"Borough": b} for b in expected["Borough"]])
+        self.assertEqual(list(pyob.from_url(URL_ARROW, dict, columns=["Borough", "BIN"])), ["Borough", "BIN"])
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_from_url_arrow_stream(self):
+        table = pyarrow.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "example.arrows")
+            with ipc.new_stream(path, table.schema) as writer:
+                writer.write_table(table, max_chunksize=2)
+            self.assertEqual(pyob.from_url(path, list), table.to_pylist())
+            self.assertEqual(list(pyob.iter_url(path)), table.to_pylist())
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_iter_url_parquet_arrow(self):
+        expected = parquet.read_table(URL_PARQUET).to_pylist()
+        self.assertEqual(list(pyob.iter_url(URL_PARQUET)), expected)
+        self.assertEqual(list(pyob.iter_url(URL_ARROW)), expected)
+        self.assertEqual(list(pyob.iter_url(f"{self.url_server}/example.parquet")), expected)
+
 
 if __name__ == "__main__":
     unittest.main()